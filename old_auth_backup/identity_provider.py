@@ -16,10 +16,12 @@ class AccessToken:
     def __init__(self, token: str, claims: dict, scopes: list):
         self.token = token
         self.claims = claims
+        self.sub = claims.get("sub", "unknown")
         self.scopes = scopes
+        self._scope_set = scopes if isinstance(scopes, frozenset) else frozenset(scopes)
         
     def has_scope(self, scope: str) -> bool:
-        return scope in self.scopes
+        return scope in self._scope_set
 
 
 class IdentityProviderAuth:
@@ -11,6 +11,9 @@ from config import get_auth_config
 
 logger = logging.getLogger(__name__)
 
+_BEARER_PREFIX = "Bearer "
+_BEARER_LEN = len(_BEARER_PREFIX)
+
 # Context variable to store the current request's Bearer token
 current_bearer_token: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
     'current_bearer_token', default=None
@@ -44,13 +47,14 @@ class MCPAuthMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
         
         # Extract Authorization header
-        auth_header = request.headers.get('authorization') or request.headers.get('Authorization')
+        # Starlette's Headers lookup is case-insensitive, one probe is enough
+        auth_header = request.headers.get('authorization')
         token = None
         
         if auth_header:
             logger.debug(f"[MIDDLEWARE] Found Authorization header: {auth_header[:50]}...")
-            if auth_header.startswith('Bearer '):
-                token = auth_header[7:]  # Remove "Bearer " prefix
+            if auth_header.startswith(_BEARER_PREFIX):
+                token = auth_header[_BEARER_LEN:]
                 logger.info("[MIDDLEWARE] Extracted Bearer token from Authorization header")
                 token_preview = f"{token[:20]}...{token[-10:]}" if len(token) > 30 else token[:50]
                 logger.debug(f"[MIDDLEWARE] Token preview: {token_preview}")
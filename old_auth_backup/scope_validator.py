@@ -1,34 +1,44 @@
 """Scope validation utilities for FastMCP ServiceNow server."""
 
+import functools
 import logging
-from typing import Optional
+from typing import FrozenSet, Optional
 from fastapi import HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from config import get_auth_config
+from config import ensure_env_loaded, get_auth_config
 from .identity_provider import AccessToken
 import builtins
 import os
 
 logger = logging.getLogger(__name__)
 
+# Test token fallback; the environment does not change after startup
+ensure_env_loaded()
+_TEST_TOKEN = os.environ.get('MCP_TEST_AUTH_TOKEN')
+
 # HTTPBearer security scheme for standard Bearer token authentication
 security = HTTPBearer(auto_error=False)
 
 
+@functools.lru_cache(maxsize=1)
+def _cached_all_scopes() -> FrozenSet[str]:
+    """Return every supported scope as an immutable set."""
+    return get_auth_config().all_scopes_set
+
+
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
 ) -> AccessToken:
     """Get current authenticated user from Bearer token using FastAPI dependency injection."""
     
     # Check if authentication is enabled
-    auth_config = get_auth_config()
-    if not auth_config.enable_auth:
-        logger.debug("[AUTH] Authentication disabled, creating mock user")
+    if not get_auth_config().enable_auth:
+        logger.debug("[AUTH] Authentication disabled, using mock user")
         # Return mock user when auth is disabled
         return AccessToken(
             token="disabled",
             claims={"sub": "mock-user-auth-disabled"},
-            scopes=auth_config.all_scopes
+            scopes=_cached_all_scopes()
         )
     
     # Get the global auth provider
@@ -41,15 +51,14 @@ async def get_current_user(
     token = None
     if credentials:
         token = credentials.credentials
-        logger.info(f"[AUTH] Extracted Bearer token from Authorization header")
-        token_preview = f"{token[:20]}...{token[-10:]}" if len(token) > 30 else token
-        logger.debug(f"[AUTH] Token preview: {token_preview}")
+        if logger.isEnabledFor(logging.DEBUG):
+            token_preview = f"{token[:20]}...{token[-10:]}" if len(token) > 30 else token
+            logger.debug("[AUTH] Extracted Bearer token from Authorization header: %s", token_preview)
     
     # Fallback to test token from environment (for testing)
     if not token:
-        test_token = os.environ.get('MCP_TEST_AUTH_TOKEN')
-        if test_token:
-            token = test_token
+        if _TEST_TOKEN:
+            token = _TEST_TOKEN
             logger.debug("[AUTH] Using test token from MCP_TEST_AUTH_TOKEN environment variable")
     
     if not token:
@@ -65,30 +74,33 @@ async def get_current_user(
             logger.warning("[AUTH] Bearer token validation failed")
             raise HTTPException(status_code=401, detail="Invalid Bearer token")
         
-        logger.info(f"[AUTH] Bearer authentication successful for user: {access_token.claims.get('sub', 'unknown')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[AUTH] Bearer authentication successful for user: %s", access_token.sub)
         return access_token
         
     except HTTPException:
         raise  # Re-raise HTTP exceptions as-is
     except Exception as e:
-        logger.error(f"[AUTH] Authentication error: {e}")
+        logger.error("[AUTH] Authentication error: %s", e)
         raise HTTPException(status_code=401, detail="Authentication failed")
 
 
 def require_scope(required_scope: str):
     """FastAPI dependency to check if user has required scope."""
     async def scope_checker(user: AccessToken = Depends(get_current_user)) -> AccessToken:
-        logger.debug(f"[SCOPE] Checking required scope: {required_scope}")
-        logger.debug(f"[SCOPE] User: {user.claims.get('sub', 'unknown')}, Available scopes: {user.scopes}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SCOPE] Checking required scope: %s", required_scope)
+            logger.debug("[SCOPE] User: %s, Available scopes: %s", user.sub, user.scopes)
         
-        if required_scope not in user.scopes:
-            logger.warning(f"[SCOPE] Access DENIED - Missing scope '{required_scope}'. Available: {user.scopes}")
+        if not user.has_scope(required_scope):
+            logger.warning("[SCOPE] Access DENIED - Missing scope '%s'. Available: %s", required_scope, user.scopes)
             raise HTTPException(
                 status_code=403, 
                 detail=f"Insufficient permissions. Required scope: {required_scope}"
             )
         
-        logger.info(f"[SCOPE] Access GRANTED - Scope '{required_scope}' verified for user: {user.claims.get('sub', 'unknown')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SCOPE] Access GRANTED - Scope '%s' verified for user: %s", required_scope, user.sub)
         return user
     
     return scope_checker
@@ -109,17 +121,16 @@ async def check_scope_access(required_scope: str) -> AccessToken:
     Raises:
         HTTPException: If authentication or authorization fails
     """
-    logger.info(f"[SCOPE] Authentication check started - Required scope: {required_scope}")
+    logger.debug("[SCOPE] Authentication check started - Required scope: %s", required_scope)
     
     # Check if authentication is enabled
-    auth_config = get_auth_config()
-    if not auth_config.enable_auth:
-        logger.info("[AUTH] Authentication disabled, creating mock user")
+    if not get_auth_config().enable_auth:
+        logger.debug("[AUTH] Authentication disabled, using mock user")
         # Return mock user when auth is disabled
         return AccessToken(
             token="disabled",
             claims={"sub": "mock-user-auth-disabled"},
-            scopes=auth_config.all_scopes
+            scopes=_cached_all_scopes()
         )
     
     # Get the global auth provider
@@ -128,7 +139,7 @@ async def check_scope_access(required_scope: str) -> AccessToken:
         logger.warning("[AUTH] No auth provider available")
         raise HTTPException(status_code=500, detail="Authentication provider not initialized")
     
-    logger.info(f"[AUTH] Starting token extraction process...")
+    logger.debug("[AUTH] Starting token extraction process...")
     # Primary method: Get token from middleware context (MCP OAuth standard)
     token = None
     
@@ -136,7 +147,7 @@ async def check_scope_access(required_scope: str) -> AccessToken:
         from auth.mcp_auth_middleware import get_current_bearer_token
         token = get_current_bearer_token()
         if token:
-            logger.info("[AUTH] Retrieved Bearer token from middleware context")
+            logger.debug("[AUTH] Retrieved Bearer token from middleware context")
         else:
             logger.debug("[AUTH] No token found in middleware context")
     except ImportError:
@@ -144,9 +155,8 @@ async def check_scope_access(required_scope: str) -> AccessToken:
     
     # Fallback for testing only
     if not token:
-        test_token = os.environ.get('MCP_TEST_AUTH_TOKEN')
-        if test_token:
-            token = test_token
+        if _TEST_TOKEN:
+            token = _TEST_TOKEN
             logger.debug("[AUTH] Using test token from MCP_TEST_AUTH_TOKEN environment variable")
     
     # Note: In proper MCP OAuth implementation, the token should be available
@@ -165,17 +175,16 @@ async def check_scope_access(required_scope: str) -> AccessToken:
             logger.warning("[AUTH] Bearer token validation failed")
             raise HTTPException(status_code=401, detail="Invalid Bearer token")
         
-        logger.info(f"[AUTH] Bearer authentication successful for user: {access_token.claims.get('sub', 'unknown')}")
-        
         # Check if token has required scope
-        if required_scope not in access_token.scopes:
-            logger.warning(f"[SCOPE] Access DENIED - Missing scope '{required_scope}'. Available: {access_token.scopes}")
+        if not access_token.has_scope(required_scope):
+            logger.warning("[SCOPE] Access DENIED - Missing scope '%s'. Available: %s", required_scope, access_token.scopes)
             raise HTTPException(
                 status_code=403, 
                 detail=f"Insufficient permissions. Required scope: {required_scope}"
             )
         
-        logger.info(f"[SCOPE] Access GRANTED - Scope '{required_scope}' verified for user: {access_token.claims.get('sub', 'unknown')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SCOPE] Access GRANTED - Scope '%s' verified for user: %s", required_scope, access_token.sub)
         return access_token
         
     except HTTPException:
@@ -204,5 +213,5 @@ def get_current_user_info() -> Optional[dict]:
             "expires": token.claims.get("exp")
         }
     except Exception as e:
-        logger.debug(f"Could not get user info: {e}")
+        logger.debug("Could not get user info: %s", e)
         return None
\ No newline at end of file
@@ -1,11 +1,17 @@
 """ServiceNow API client module."""
 
 from .client import ServiceNowClient
-from .exceptions import ServiceNowAPIError, ServiceNowAuthError, ServiceNowNotFoundError
+from .exceptions import (
+    ServiceNowAPIError,
+    ServiceNowAuthError,
+    ServiceNowNotFoundError,
+    ServiceNowValidationError,
+)
 
 __all__ = [
     "ServiceNowClient",
     "ServiceNowAPIError",
     "ServiceNowAuthError",
     "ServiceNowNotFoundError",
+    "ServiceNowValidationError",
 ]
\ No newline at end of file
@@ -3,8 +3,9 @@
 import asyncio
 import logging
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 import httpx
+import orjson
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -40,6 +41,7 @@ class ServiceNowClient:
         self._access_token = None
         self._token_expires_at = 0
         self._token_lock = asyncio.Lock()
+        self._auth_header_token = None
         
     async def _get_access_token(self) -> str:
         """Get a valid access token, refreshing if necessary."""
@@ -51,38 +53,40 @@ class ServiceNowClient:
             logger.debug("Requesting new OAuth2 access token")
             
             try:
-                # Request new token using client credentials flow
-                async with httpx.AsyncClient(verify=self.config.verify_ssl) as client:
-                    response = await client.post(
-                        self.config.oauth_token_url,
-                        data={
-                            "grant_type": "client_credentials",
-                            "client_id": self.config.client_id,
-                            "client_secret": self.config.client_secret,
-                        },
-                        headers={
-                            "Content-Type": "application/x-www-form-urlencoded",
-                            "Accept": "application/json",
-                        },
-                        timeout=httpx.Timeout(30.0),
+                # Request new token using client credentials flow; the token
+                # client is kept so refreshes reuse its connection
+                if self._oauth_client is None:
+                    self._oauth_client = httpx.AsyncClient(verify=self.config.verify_ssl)
+                response = await self._oauth_client.post(
+                    self.config.oauth_token_url,
+                    data={
+                        "grant_type": "client_credentials",
+                        "client_id": self.config.client_id,
+                        "client_secret": self.config.client_secret,
+                    },
+                    headers={
+                        "Content-Type": "application/x-www-form-urlencoded",
+                        "Accept": "application/json",
+                    },
+                    timeout=httpx.Timeout(30.0, connect=self.config.connect_timeout),
+                )
+                
+                if response.status_code == 401:
+                    raise ServiceNowAuthError(
+                        "OAuth2 authentication failed: Invalid client credentials",
+                        status_code=401
                     )
-                    
-                    if response.status_code == 401:
-                        raise ServiceNowAuthError(
-                            "OAuth2 authentication failed: Invalid client credentials",
-                            status_code=401
-                        )
-                    
-                    response.raise_for_status()
-                    token_data = response.json()
-                    
-                    self._access_token = token_data["access_token"]
-                    expires_in = token_data.get("expires_in", 1800)  # Default 30 minutes
-                    self._token_expires_at = time.time() + expires_in
-                    
-                    logger.info(f"OAuth2 token obtained successfully (expires in {expires_in}s)")
-                    return self._access_token
-                    
+                
+                response.raise_for_status()
+                token_data = orjson.loads(response.content)
+                
+                self._access_token = token_data["access_token"]
+                expires_in = token_data.get("expires_in", 1800)  # Default 30 minutes
+                self._token_expires_at = time.time() + expires_in
+                
+                logger.info(f"OAuth2 token obtained successfully (expires in {expires_in}s)")
+                return self._access_token
+                
             except httpx.HTTPStatusError as e:
                 logger.error(f"HTTP error getting OAuth2 token: {e}")
                 raise ServiceNowAuthError(
@@ -102,16 +106,23 @@ class ServiceNowClient:
         if self._client is None:
             self._client = httpx.AsyncClient(
                 base_url=self.config.base_url,
-                timeout=httpx.Timeout(self.config.timeout),
+                timeout=httpx.Timeout(self.config.timeout, connect=self.config.connect_timeout),
                 verify=self.config.verify_ssl,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive_connections,
+                ),
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                },
             )
+            self._auth_header_token = None
         
-        # Update authorization header with current token
-        self._client.headers.update({
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        })
+        # Update authorization header only when the token has changed
+        if token is not self._auth_header_token:
+            self._client.headers["Authorization"] = f"Bearer {token}"
+            self._auth_header_token = token
         
         return self._client
     
@@ -152,7 +163,7 @@ class ServiceNowClient:
                 method=method,
                 url=endpoint,
                 params=params,
-                json=json_data,
+                content=orjson.dumps(json_data) if json_data is not None else None,
             )
             
             logger.debug(f"{method} {endpoint} - Status: {response.status_code}")
@@ -179,7 +190,7 @@ class ServiceNowClient:
             elif response.status_code >= 400:
                 error_data = None
                 try:
-                    error_data = response.json()
+                    error_data = orjson.loads(response.content)
                 except Exception:
                     pass
                 
@@ -192,7 +203,7 @@ class ServiceNowClient:
             
             response.raise_for_status()
             logger.debug(f"Successfully completed request to {endpoint}")
-            return response.json()
+            return orjson.loads(response.content)
             
         except httpx.TransportError as e:
             logger.error(f"Network error making request to {endpoint}: {e}")
@@ -278,11 +289,18 @@ class ServiceNowClient:
             logger.error(f"Error creating incident: {e}")
             raise
     
-    async def search_incidents(self, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    async def search_incidents(
+        self,
+        search_params: Dict[str, Any],
+        fields: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
         """Search incident records based on query parameters.
         
         Args:
             search_params: Dictionary containing search parameters
+            fields: Columns to return for each record (sysparm_fields); all if None
+            limit: Maximum number of records to return (sysparm_limit); no limit if None
             
         Returns:
             Search results with list of matching incidents
@@ -294,17 +312,33 @@ class ServiceNowClient:
         logger.info(f"Searching incidents with parameters: {search_params}")
         
         try:
-            response = await self._make_request("GET", endpoint, params=search_params)
+            params = search_params
+            if fields or limit:
+                params = dict(search_params)
+                if fields:
+                    params["sysparm_fields"] = ",".join(fields)
+                if limit:
+                    params["sysparm_limit"] = limit
+            response = await self._make_request("GET", endpoint, params=params)
             return response.get("result", response)
         except Exception as e:
             logger.error(f"Error searching incidents: {e}")
             raise
 
-    async def search_change_requests(self, search_params: Dict[str, Any]) -> Dict[str, Any]:
+    async def search_change_requests(
+        self,
+        search_params: Dict[str, Any],
+        fields: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Dict[str, Any]:
         """Search change request records based on query parameters.
         
         Args:
             search_params: Dictionary containing search parameters
+            fields: Columns to return for each record (sysparm_fields); all if None
+            limit: Maximum number of records to return (sysparm_limit); no limit if None
+            offset: Number of matching records to skip (sysparm_offset)
             
         Returns:
             Search results with list of matching change requests
@@ -319,6 +353,12 @@ class ServiceNowClient:
             for key, value in search_params.items():
                 if value is not None:
                     params[key] = str(value).lower() if isinstance(value, bool) else str(value)
+            if fields:
+                params["sysparm_fields"] = ",".join(fields)
+            if limit:
+                params["sysparm_limit"] = limit
+            if offset:
+                params["sysparm_offset"] = offset
             
             logger.debug(f"Searching change requests with params: {params}")
             
@@ -418,7 +458,7 @@ class ServiceNowClient:
                 else:
                     processed_data[key] = value
             
-            response = await self._make_request("PUT", endpoint, json=processed_data)
+            response = await self._make_request("PUT", endpoint, json_data=processed_data)
             
             logger.info(f"Successfully updated change request: {changerequest_number}")
             return response
@@ -541,11 +581,26 @@ class ServiceNowClient:
             logger.error(f"Error creating incident task: {e}")
             raise
     
+    async def preconnect(self) -> None:
+        """Fetch an access token and open a pooled connection ahead of the first request.
+        
+        Failures are logged and ignored; the first real request retries as usual.
+        """
+        try:
+            client = await self._get_client()
+            await client.head("/")
+            logger.debug("Pre-connected to %s", self.config.base_url)
+        except Exception as e:
+            logger.warning("ServiceNow pre-connect failed: %s", e)
+    
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP clients."""
         if self._client:
             await self._client.aclose()
             self._client = None
+        if self._oauth_client:
+            await self._oauth_client.aclose()
+            self._oauth_client = None
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -4,7 +4,8 @@ import functools
 import logging
 from typing import Callable, Any
 
-from .simple_middleware import require_scope_simple
+from config import get_auth_config
+from .simple_middleware import get_current_user, require_scope_simple
 
 logger = logging.getLogger(__name__)
 
@@ -12,28 +13,28 @@ logger = logging.getLogger(__name__)
 def requires_scope(scope: str):
     """Decorator to require specific scope for MCP tool handlers.
     
+    When authentication is disabled the handler is returned unwrapped, so
+    the check costs nothing per call. The auth setting is read once at
+    decoration time.
+    
     Usage:
         @requires_scope("servicenow.incident.read")
         async def get_incident(incident_number: str) -> str:
             # Handler implementation
     """
     def decorator(func: Callable) -> Callable:
+        # Skip authentication when disabled
+        if not get_auth_config().enable_auth:
+            return func
+        
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            # Check if authentication is enabled
-            from config import get_auth_config
-            auth_config = get_auth_config()
+            # Check scope when auth is enabled
+            user_info = require_scope_simple(scope)
             
-            if auth_config.enable_auth:
-                # Check scope when auth is enabled
-                user_info = require_scope_simple(scope)
-                
-                # Log access
-                user = user_info.get("user", "unknown")
-                logger.info(f"User '{user}' accessing {func.__name__} with scope '{scope}'")
-            else:
-                # Skip authentication when disabled
-                logger.debug(f"Authentication disabled - allowing access to {func.__name__}")
+            # Log access
+            logger.debug("User '%s' accessing %s with scope '%s'",
+                         user_info.user, func.__name__, scope)
             
             # Call original function
             return await func(*args, **kwargs)
@@ -46,14 +47,12 @@ def optional_auth(func: Callable) -> Callable:
     """Decorator for handlers that work with or without authentication."""
     @functools.wraps(func)
     async def wrapper(*args, **kwargs) -> Any:
-        from .simple_middleware import get_current_user
-        
         user_info = get_current_user()
-        if user_info and user_info["authenticated"]:
-            user = user_info.get("user", "unknown")
-            logger.info(f"Authenticated user '{user}' accessing {func.__name__}")
+        if user_info and user_info.authenticated:
+            logger.debug("Authenticated user '%s' accessing %s",
+                         user_info.user, func.__name__)
         else:
-            logger.info(f"Anonymous access to {func.__name__}")
+            logger.debug("Anonymous access to %s", func.__name__)
         
         return await func(*args, **kwargs)
     
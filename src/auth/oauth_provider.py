@@ -1,13 +1,17 @@
 """OAuth authentication provider for MCP server."""
 
-import json
+import asyncio
+import hashlib
+import hmac
 import logging
 import secrets
 import urllib.parse
 from typing import Dict, Optional, Any
 from fastapi import HTTPException
 import httpx
+import orjson
 from config import get_auth_config
+from .unified_auth import get_auth
 
 logger = logging.getLogger(__name__)
 
@@ -15,17 +19,49 @@ logger = logging.getLogger(__name__)
 class OAuthProvider:
     """OAuth authentication provider for MCP server."""
     
+    # Invariant parts of the Authorization Server Metadata documents (RFC 8414)
+    _AS_STATIC_OIDC: Dict[str, Any] = {
+        "response_types_supported": ("code", "id_token", "code id_token"),
+        "grant_types_supported": ("authorization_code", "client_credentials", "refresh_token"),
+        "code_challenge_methods_supported": ("S256",),
+        "token_endpoint_auth_methods_supported": ("client_secret_basic", "client_secret_post"),
+        "id_token_signing_alg_values_supported": ("RS256",),
+        "response_modes_supported": ("query", "fragment"),
+        "subject_types_supported": ("public",),
+    }
+    _AS_STATIC_OAUTH: Dict[str, Any] = {
+        "response_types_supported": ("code",),
+        "grant_types_supported": ("authorization_code", "client_credentials"),
+        "code_challenge_methods_supported": ("S256",),
+        "token_endpoint_auth_methods_supported": ("client_secret_basic", "client_secret_post"),
+        "response_modes_supported": ("query",),
+        "id_token_signing_alg_values_supported": ("RS256",),
+        "subject_types_supported": ("public",),
+    }
+    
     def __init__(self):
         """Initialize OAuth provider."""
         self.config = get_auth_config()
         self._client_registrations: Dict[str, Dict[str, Any]] = {}
         
+        # Metadata documents only depend on config, so build them once
+        self._prm_doc: Optional[Dict[str, Any]] = None
+        self._as_doc: Optional[Dict[str, Any]] = None
+        
+        # Defaults for dynamic client registration requests
+        self._default_client_name = "MCP Client"
+        self._default_redirect_uris = (self.config.oauth_redirect_uri,)
+        self._default_scope = self.config.oauth_scope
+        
     def get_protected_resource_metadata(self) -> Dict[str, Any]:
         """Generate Protected Resource Metadata (PRM) document.
         
         Returns:
             Dictionary containing resource metadata per RFC 8707
         """
+        if self._prm_doc is not None:
+            return self._prm_doc
+        
         # Extract authorization server base URL (supports various identity provider patterns)
         if '/oidc' in self.config.oauth_authorization_endpoint:
             # Identity provider with OIDC endpoint pattern
@@ -34,20 +70,22 @@ class OAuthProvider:
             # Standard OAuth endpoint pattern
             authorization_server_base = self.config.oauth_authorization_endpoint.split('/oauth')[0]
         
-        return {
+        resource_documentation = f"{self.config.resource_server_url}/docs"
+        self._prm_doc = {
             "resource": self.config.resource_server_url,
             "authorization_servers": [
                 {
                     "authorization_server": authorization_server_base,
                     "scopes_supported": self.config.all_scopes,
-                    "bearer_methods_supported": ["header"],
-                    "resource_documentation": f"{self.config.resource_server_url}/docs",
+                    "bearer_methods_supported": ("header",),
+                    "resource_documentation": resource_documentation,
                     "resource_policy_uri": f"{self.config.resource_server_url}/policy"
                 }
             ],
             "resource_server": self.config.resource_server_url,
-            "resource_documentation": f"{self.config.resource_server_url}/docs"
+            "resource_documentation": resource_documentation
         }
+        return self._prm_doc
     
     def get_authorization_server_metadata(self) -> Dict[str, Any]:
         """Generate Authorization Server Metadata document.
@@ -55,46 +93,38 @@ class OAuthProvider:
         Returns:
             Dictionary containing authorization server metadata per RFC 8414
         """
+        if self._as_doc is not None:
+            return self._as_doc
+        
         # Check if this is an external identity provider with OIDC support
         if '/oidc' in self.config.oauth_authorization_endpoint:
             # External identity provider with OIDC endpoint
             base_url = self.config.oauth_authorization_endpoint.split('/oidc')[0]
             
-            return {
+            self._as_doc = {
                 "issuer": self.config.identity_discovery_url or base_url,
                 "authorization_endpoint": self.config.oauth_authorization_endpoint,
                 "token_endpoint": self.config.oauth_token_endpoint,
                 "jwks_uri": self.config.identity_jwks_uri,
-                "scopes_supported": self.config.all_scopes + ["openid", "profile", "email", "offline_access"],
-                "response_types_supported": ["code", "id_token", "code id_token"],
-                "grant_types_supported": ["authorization_code", "client_credentials", "refresh_token"],
-                "code_challenge_methods_supported": ["S256"],
-                "token_endpoint_auth_methods_supported": ["client_secret_basic", "client_secret_post"],
-                "id_token_signing_alg_values_supported": ["RS256"],
-                "response_modes_supported": ["query", "fragment"],
-                "subject_types_supported": ["public"],
+                "scopes_supported": [*self.config.all_scopes, "openid", "profile", "email", "offline_access"],
+                **self._AS_STATIC_OIDC,
                 "userinfo_endpoint": f"{base_url}/oidc/userinfo"
             }
         else:
             # Standard OAuth server
             base_url = self.config.oauth_authorization_endpoint.split('/oauth')[0]
             
-            return {
+            self._as_doc = {
                 "issuer": base_url,
                 "authorization_endpoint": self.config.oauth_authorization_endpoint,
                 "token_endpoint": self.config.oauth_token_endpoint,
                 "jwks_uri": self.config.identity_jwks_uri,
-                "scopes_supported": self.config.all_scopes + ["openid", "profile", "email"],
-                "response_types_supported": ["code"],
-                "grant_types_supported": ["authorization_code", "client_credentials"],
-                "code_challenge_methods_supported": ["S256"],
-                "token_endpoint_auth_methods_supported": ["client_secret_basic", "client_secret_post"],
+                "scopes_supported": [*self.config.all_scopes, "openid", "profile", "email"],
                 "registration_endpoint": f"{base_url}/oauth/register",
-                "response_modes_supported": ["query"],
-                "id_token_signing_alg_values_supported": ["RS256"],
-                "subject_types_supported": ["public"],
+                **self._AS_STATIC_OAUTH,
                 "userinfo_endpoint": f"{base_url}/oauth/userinfo"
             }
+        return self._as_doc
     
     def generate_client_id_metadata_document(self, client_id: str, redirect_uris: list) -> Dict[str, Any]:
         """Generate Client ID Metadata Document (CIMD).
@@ -135,19 +165,32 @@ class OAuthProvider:
         client_id = f"mcp_client_{secrets.token_urlsafe(16)}"
         client_secret = secrets.token_urlsafe(32)
         
+        redirect_uris = registration_request.get("redirect_uris")
+        if redirect_uris is None:
+            redirect_uris = self._default_redirect_uris
+        client_name = registration_request.get("client_name")
+        if client_name is None:
+            client_name = self._default_client_name
+        scope = registration_request.get("scope")
+        if scope is None:
+            scope = self._default_scope
+        
         client_metadata = {
             "client_id": client_id,
             "client_secret": client_secret,
-            "client_name": registration_request.get("client_name", "MCP Client"),
-            "redirect_uris": registration_request.get("redirect_uris", [self.config.oauth_redirect_uri]),
+            "client_name": client_name,
+            "redirect_uris": redirect_uris,
             "grant_types": ["authorization_code"],
             "response_types": ["code"],
-            "scope": registration_request.get("scope", self.config.oauth_scope),
+            "scope": scope,
             "token_endpoint_auth_method": "client_secret_basic"
         }
         
-        # Store client registration
-        self._client_registrations[client_id] = client_metadata
+        # Store client registration with only a digest of the secret; the
+        # plaintext is returned to the client once and never kept
+        stored_metadata = {k: v for k, v in client_metadata.items() if k != "client_secret"}
+        stored_metadata["client_secret_hash"] = _hash_secret(client_secret)
+        self._client_registrations[client_id] = stored_metadata
         logger.info(f"Dynamically registered client: {client_id}")
         
         return client_metadata
@@ -223,6 +266,11 @@ class OAuthProvider:
             "code_verifier": code_verifier
         }
         
+        # Refresh the JWKS while the token request is in flight so validating
+        # the new token does not pay for the key fetch afterwards
+        auth = get_auth()
+        jwks_task = asyncio.create_task(auth.warm_jwks()) if auth.jwks_client else None
+        
         try:
             async with httpx.AsyncClient() as client:
                 response = await client.post(
@@ -234,6 +282,9 @@ class OAuthProvider:
                     }
                 )
                 
+                if jwks_task is not None:
+                    await asyncio.shield(jwks_task)
+                
                 if response.status_code != 200:
                     logger.error(f"Token exchange failed: {response.status_code} - {response.text}")
                     raise HTTPException(
@@ -241,7 +292,7 @@ class OAuthProvider:
                         detail=f"Token exchange failed: {response.text}"
                     )
                 
-                token_response = response.json()
+                token_response = orjson.loads(response.content)
                 logger.info(f"Successfully exchanged code for token (client: {client_id})")
                 
                 return token_response
@@ -252,6 +303,12 @@ class OAuthProvider:
                 status_code=503,
                 detail="Unable to contact authorization server"
             )
+        finally:
+            # The refresh is only worth finishing for a token we received;
+            # never leave it running unreferenced after a failed request
+            if jwks_task is not None and not jwks_task.done():
+                jwks_task.cancel()
+                await asyncio.gather(jwks_task, return_exceptions=True)
     
     def validate_client_credentials(self, client_id: str, client_secret: Optional[str] = None) -> bool:
         """Validate client credentials against registered clients.
@@ -270,8 +327,9 @@ class OAuthProvider:
         client_data = self._client_registrations[client_id]
         
         # For confidential clients, verify secret
-        if "client_secret" in client_data:
-            if client_secret != client_data["client_secret"]:
+        secret_hash = client_data.get("client_secret_hash")
+        if secret_hash is not None:
+            if client_secret is None or not hmac.compare_digest(secret_hash, _hash_secret(client_secret)):
                 logger.warning(f"Invalid client secret for client: {client_id}")
                 return False
                 
@@ -311,4 +369,9 @@ class OAuthProvider:
         if error_description:
             auth_params.append(f'error_description="{error_description}"')
             
-        return f"Bearer {', '.join(auth_params)}"
\ No newline at end of file
+        return f"Bearer {', '.join(auth_params)}"
+
+
+def _hash_secret(client_secret: str) -> bytes:
+    """Return the SHA-256 digest used to store and compare client secrets."""
+    return hashlib.sha256(client_secret.encode()).digest()
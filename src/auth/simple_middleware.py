@@ -2,20 +2,34 @@
 
 import logging
 from typing import Optional
+from fastapi import HTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 import contextvars
 
-from .unified_auth import get_auth
+from .unified_auth import AuthResult, get_auth
 
 logger = logging.getLogger(__name__)
 
+# Path prefixes served without authentication
+_PUBLIC_PREFIXES = ("/.well-known/", "/oauth/", "/health")
+_MCP_PREFIX = "/mcp/"
+
+_BEARER_PREFIX = "Bearer "
+_BEARER_LEN = len(_BEARER_PREFIX)
+
+
 # Context variable for current user
-current_user: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar(
+current_user: contextvars.ContextVar[Optional[AuthResult]] = contextvars.ContextVar(
     'current_user', default=None
 )
 
+# Context variable for the request being handled
+current_request: contextvars.ContextVar[Optional[Request]] = contextvars.ContextVar(
+    'current_request', default=None
+)
+
 
 class SimpleAuthMiddleware(BaseHTTPMiddleware):
     """Simplified authentication middleware."""
@@ -23,21 +37,19 @@ class SimpleAuthMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
         """Extract token and authenticate user."""
         
-        # Skip auth for public endpoints
-        public_paths = [
-            "/.well-known/",
-            "/oauth/",
-            "/health"
-        ]
+        current_request.set(request)
         
-        if any(request.url.path.startswith(path) for path in public_paths):
+        path = request.url.path
+        
+        # Skip auth for public endpoints
+        if path.startswith(_PUBLIC_PREFIXES):
             return await call_next(request)
         
         # Extract Bearer token
         token = None
         auth_header = request.headers.get('authorization')
-        if auth_header and auth_header.startswith('Bearer '):
-            token = auth_header[7:]
+        if auth_header and auth_header.startswith(_BEARER_PREFIX):
+            token = auth_header[_BEARER_LEN:]
         
         # Authenticate
         auth = get_auth()
@@ -47,38 +59,41 @@ class SimpleAuthMiddleware(BaseHTTPMiddleware):
         current_user.set(user_info)
         
         # Check if authentication failed for protected endpoints
-        if request.url.path.startswith('/mcp/') and not user_info["authenticated"]:
+        if path.startswith(_MCP_PREFIX) and not user_info.authenticated:
             return JSONResponse(
                 status_code=401,
-                content={"error": "unauthorized", "detail": user_info.get("error", "Authentication required")},
+                content={"error": "unauthorized", "detail": user_info.error or "Authentication required"},
                 headers={"WWW-Authenticate": auth.generate_www_authenticate("invalid_token")}
             )
         
         return await call_next(request)
 
 
-def get_current_user() -> Optional[dict]:
+def get_current_user() -> Optional[AuthResult]:
     """Get current authenticated user info."""
     return current_user.get()
 
 
-def require_scope_simple(required_scope: str) -> dict:
+def get_current_request() -> Optional[Request]:
+    """Get the HTTP request currently being handled, if any."""
+    return current_request.get()
+
+
+def require_scope_simple(required_scope: str) -> AuthResult:
     """Check if current user has required scope."""
-    from fastapi import HTTPException
-    
     user_info = get_current_user()
     
     if not user_info:
         raise HTTPException(status_code=401, detail="No authentication context")
     
-    if not user_info["authenticated"]:
+    if not user_info.authenticated:
         raise HTTPException(
             status_code=401,
-            detail=user_info.get("error", "Authentication required")
+            detail=user_info.error or "Authentication required"
         )
     
     auth = get_auth()
-    if not auth.check_scope(user_info.get("scopes", []), required_scope):
+    if not auth.check_scope(user_info.scopes, required_scope):
         raise HTTPException(
             status_code=403,
             detail=f"Missing required scope: {required_scope}"
@@ -1,13 +1,60 @@
 """Simplified unified authentication for ServiceNow MCP Server."""
 
+import asyncio
+import functools
+import hashlib
 import logging
 import os
-from typing import Optional, Dict, Any
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Collection, FrozenSet, Tuple
 import jwt
+from fastapi import HTTPException
 from jwt import PyJWKClient
 
+from config import ensure_env_loaded, get_auth_config
+
 logger = logging.getLogger(__name__)
 
+# Test token fallback; the environment does not change after startup
+ensure_env_loaded()
+_TEST_TOKEN = os.environ.get('MCP_TEST_AUTH_TOKEN')
+
+# Decode settings shared by every JWT validation
+_JWT_DECODE_OPTIONS = {"verify_exp": True, "verify_aud": False}
+_RS256 = ["RS256"]
+_HS256 = ["HS256"]
+
+# Bounds for the validated-token cache
+_TOKEN_CACHE_TTL = 300.0
+_TOKEN_CACHE_MAXSIZE = 4096
+
+
+@functools.lru_cache(maxsize=32)
+def _get_jwks_client(uri: str) -> PyJWKClient:
+    """Return a shared JWKS client for uri with key set and key caching enabled."""
+    return PyJWKClient(uri, cache_jwk_set=True, cache_keys=True, lifespan=600)
+
+
+@dataclass(slots=True, frozen=True)
+class AuthResult:
+    """Outcome of validating a Bearer token."""
+    
+    authenticated: bool
+    user: str = "unknown"
+    scopes: FrozenSet[str] = frozenset()
+    mode: str = ""
+    error: Optional[str] = None
+    claims: Optional[Dict[str, Any]] = None
+
+
+# Shared failure results
+_INVALID_MOCK_TOKEN = AuthResult(False, mode="mock", error="Invalid mock token")
+_JWT_EXPIRED = AuthResult(False, mode="identity-provider", error="Token expired")
+_JWKS_NOT_INITIALIZED = AuthResult(False, mode="identity-provider", error="JWKS client not initialized")
+_OAUTH_EXPIRED = AuthResult(False, mode="oauth", error="Token expired")
+
 
 class UnifiedAuth:
     """Simplified authentication handler for all auth modes."""
@@ -17,167 +64,244 @@ class UnifiedAuth:
         self.config = config
         self.enabled = config.enable_auth
         self.mode = config.auth_mode if self.enabled else "disabled"
+        self._all_scopes = config.all_scopes_set
+        self._disabled_result = AuthResult(True, user="anonymous", scopes=self._all_scopes, mode="disabled")
+        self._mock_result = AuthResult(True, user="mock-user", scopes=self._all_scopes, mode="mock")
+        self._token_required = AuthResult(False, mode=self.mode, error="Bearer token required")
+        
+        # WWW-Authenticate header; realm and resource URL are fixed after config load
+        self._www_auth_base = (
+            f'Bearer realm="{config.realm}", '
+            f'resource="{config.resource_server_url}", '
+            f'resource_metadata="{config.resource_server_url}/.well-known/oauth-protected-resource"'
+        )
+        self._www_auth_error_fmt = self._www_auth_base + ', error="{}"'
         
         # Initialize JWKS client if needed
         self.jwks_client = None
         if self.mode == "identity-provider" and config.identity_jwks_uri:
             try:
-                self.jwks_client = PyJWKClient(config.identity_jwks_uri)
-                logger.info(f"Initialized JWKS client: {config.identity_jwks_uri}")
+                self.jwks_client = _get_jwks_client(config.identity_jwks_uri)
+                logger.info("Initialized JWKS client: %s", config.identity_jwks_uri)
             except Exception as e:
-                logger.error(f"Failed to initialize JWKS: {e}")
+                logger.error("Failed to initialize JWKS: %s", e)
                 self.mode = "disabled"  # Fallback to disabled on error
+        
+        # Successful JWT/OAuth validations keyed by a BLAKE2b digest of the
+        # token -> (result, monotonic expiry)
+        self._token_cache: "OrderedDict[bytes, Tuple[AuthResult, float]]" = OrderedDict()
+        
+        # JWT validations currently running, keyed like the token cache
+        self._inflight: Dict[bytes, "asyncio.Future[AuthResult]"] = {}
+    
+    def _cached_result(self, token: str) -> Tuple[bytes, Optional[AuthResult]]:
+        """Look up a previously validated token.
+        
+        Returns:
+            The cache key and the cached result, or None on a miss
+        """
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        entry = self._token_cache.get(key)
+        if entry is None:
+            return key, None
+        
+        result, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._token_cache[key]
+            return key, None
+        
+        self._token_cache.move_to_end(key)
+        return key, result
+    
+    def _cache_result(self, key: bytes, result: AuthResult) -> None:
+        """Remember a successful validation until the token's exp (max 5 minutes)."""
+        ttl = _TOKEN_CACHE_TTL
+        exp = result.claims.get("exp")
+        if isinstance(exp, (int, float)):
+            ttl = min(ttl, exp - time.time())
+        if ttl <= 0:
+            return
+        
+        self._token_cache[key] = (result, time.monotonic() + ttl)
+        self._token_cache.move_to_end(key)
+        if len(self._token_cache) > _TOKEN_CACHE_MAXSIZE:
+            self._token_cache.popitem(last=False)
     
-    async def validate_token(self, token: Optional[str]) -> Dict[str, Any]:
+    async def warm_jwks(self) -> None:
+        """Prefetch the JWKS so the next token validation finds the keys cached."""
+        if not self.jwks_client:
+            return
+        
+        try:
+            await asyncio.to_thread(self.jwks_client.get_signing_keys)
+        except Exception as e:
+            logger.warning("JWKS warm-up failed: %s", e)
+    
+    async def validate_token(self, token: Optional[str]) -> AuthResult:
         """Validate token and return user info with scopes.
         
-        Returns dict with:
-        - authenticated: bool
-        - user: str (user identifier)
-        - scopes: list of scope strings
-        - error: str (if authentication failed)
+        Returns:
+            AuthResult with the user identifier and scopes, or the error
+            if authentication failed
+        """
+        # Only JWKS validation needs the event loop; everything else is sync
+        if token and self.enabled and self.mode == "identity-provider":
+            try:
+                return await self._validate_jwt(token)
+            except Exception as e:
+                logger.error("Auth validation error: %s", e)
+                return AuthResult(False, mode=self.mode, error=str(e))
+        
+        return self.validate_token_sync(token)
+    
+    def validate_token_sync(self, token: Optional[str]) -> AuthResult:
+        """Validate token without a coroutine, for callers outside the event loop.
+        
+        In identity-provider mode the JWKS lookup and signature check run in
+        the calling thread.
+        
+        Returns:
+            AuthResult with the user identifier and scopes, or the error
+            if authentication failed
         """
         # No auth required
         if not self.enabled:
-            return {
-                "authenticated": True,
-                "user": "anonymous",
-                "scopes": self.config.all_scopes,
-                "mode": "disabled"
-            }
+            return self._disabled_result
         
         # Token required but missing
         if not token:
-            return {
-                "authenticated": False,
-                "error": "Bearer token required",
-                "mode": self.mode
-            }
+            return self._token_required
         
         # Validate based on mode
         try:
             if self.mode == "mock":
                 return self._validate_mock(token)
             elif self.mode == "identity-provider":
-                return await self._validate_jwt(token)
+                return self._validate_jwt_blocking(token)
             elif self.mode == "oauth":
                 return self._validate_oauth(token)
             else:
-                return {
-                    "authenticated": False,
-                    "error": f"Unknown auth mode: {self.mode}",
-                    "mode": self.mode
-                }
+                return AuthResult(False, mode=self.mode, error=f"Unknown auth mode: {self.mode}")
         except Exception as e:
-            logger.error(f"Auth validation error: {e}")
-            return {
-                "authenticated": False,
-                "error": str(e),
-                "mode": self.mode
-            }
+            logger.error("Auth validation error: %s", e)
+            return AuthResult(False, mode=self.mode, error=str(e))
     
-    def _validate_mock(self, token: str) -> Dict[str, Any]:
+    def _validate_mock(self, token: str) -> AuthResult:
         """Validate mock token for testing."""
-        if token in self.config.mock_tokens:
-            return {
-                "authenticated": True,
-                "user": "mock-user",
-                "scopes": self.config.all_scopes,
-                "mode": "mock"
-            }
-        return {
-            "authenticated": False,
-            "error": "Invalid mock token",
-            "mode": "mock"
-        }
+        if token in self.config.mock_tokens_set:
+            return self._mock_result
+        return _INVALID_MOCK_TOKEN
     
-    async def _validate_jwt(self, token: str) -> Dict[str, Any]:
+    async def _validate_jwt(self, token: str) -> AuthResult:
         """Validate JWT token using JWKS."""
         if not self.jwks_client:
-            return {
-                "authenticated": False,
-                "error": "JWKS client not initialized",
-                "mode": "identity-provider"
-            }
+            return _JWKS_NOT_INITIALIZED
+        
+        key, cached = self._cached_result(token)
+        if cached is not None:
+            return cached
         
+        # Concurrent requests carrying the same token share one validation
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        
+        # Key lookup may hit the network and RSA verification is CPU bound,
+        # so keep both off the event loop
+        task = asyncio.ensure_future(asyncio.to_thread(self._decode_jwt, token))
+        self._inflight[key] = task
+        try:
+            result = await asyncio.shield(task)
+        finally:
+            self._inflight.pop(key, None)
+        
+        if result.authenticated:
+            self._cache_result(key, result)
+        return result
+    
+    def _validate_jwt_blocking(self, token: str) -> AuthResult:
+        """Validate JWT token using JWKS in the calling thread."""
+        if not self.jwks_client:
+            return _JWKS_NOT_INITIALIZED
+        
+        key, cached = self._cached_result(token)
+        if cached is not None:
+            return cached
+        
+        result = self._decode_jwt(token)
+        if result.authenticated:
+            self._cache_result(key, result)
+        return result
+    
+    def _decode_jwt(self, token: str) -> AuthResult:
+        """Verify a JWT against the JWKS and build the auth result (blocking)."""
         try:
             # Get signing key and decode token
-            signing_key = self.jwks_client.get_signing_key_from_jwt(token)
             claims = jwt.decode(
                 token,
-                signing_key.key,
-                algorithms=["RS256"],
-                options={"verify_exp": True, "verify_aud": False}
+                self.jwks_client.get_signing_key_from_jwt(token).key,
+                algorithms=_RS256,
+                options=_JWT_DECODE_OPTIONS
             )
             
             # Extract scopes
-            scopes = []
+            scopes = frozenset()
             for claim in ["scope", "scp", "scopes"]:
                 if claim in claims:
                     scope_value = claims[claim]
-                    scopes = scope_value.split() if isinstance(scope_value, str) else scope_value
+                    scopes = frozenset(scope_value.split() if isinstance(scope_value, str) else scope_value)
                     break
             
             # Default scopes if none found
             if not scopes and claims.get("sub"):
-                scopes = self.config.all_scopes
+                scopes = self._all_scopes
             
-            return {
-                "authenticated": True,
-                "user": claims.get("sub", "unknown"),
-                "scopes": scopes,
-                "claims": claims,
-                "mode": "identity-provider"
-            }
+            return AuthResult(
+                True,
+                user=claims.get("sub", "unknown"),
+                scopes=scopes,
+                mode="identity-provider",
+                claims=claims
+            )
             
         except jwt.ExpiredSignatureError:
-            return {
-                "authenticated": False,
-                "error": "Token expired",
-                "mode": "identity-provider"
-            }
+            return _JWT_EXPIRED
         except Exception as e:
-            return {
-                "authenticated": False,
-                "error": f"JWT validation failed: {str(e)}",
-                "mode": "identity-provider"
-            }
+            return AuthResult(False, mode="identity-provider", error=f"JWT validation failed: {str(e)}")
     
-    def _validate_oauth(self, token: str) -> Dict[str, Any]:
+    def _validate_oauth(self, token: str) -> AuthResult:
         """Validate OAuth token (simplified demo version)."""
+        key, cached = self._cached_result(token)
+        if cached is not None:
+            return cached
+        
         try:
             # For demo, use simple HS256 validation
             claims = jwt.decode(
                 token,
                 "demo-secret",  # In production, use proper key management
-                algorithms=["HS256"],
-                options={"verify_exp": True, "verify_aud": False}
+                algorithms=_HS256,
+                options=_JWT_DECODE_OPTIONS
             )
             
-            scopes = claims.get("scope", "").split() if "scope" in claims else []
+            scopes = frozenset(claims.get("scope", "").split()) if "scope" in claims else frozenset()
             
-            return {
-                "authenticated": True,
-                "user": claims.get("sub", claims.get("client_id", "unknown")),
-                "scopes": scopes or self.config.all_scopes,
-                "claims": claims,
-                "mode": "oauth"
-            }
+            result = AuthResult(
+                True,
+                user=claims.get("sub", claims.get("client_id", "unknown")),
+                scopes=scopes or self._all_scopes,
+                mode="oauth",
+                claims=claims
+            )
+            self._cache_result(key, result)
+            return result
             
         except jwt.ExpiredSignatureError:
-            return {
-                "authenticated": False,
-                "error": "Token expired",
-                "mode": "oauth"
-            }
+            return _OAUTH_EXPIRED
         except Exception as e:
-            return {
-                "authenticated": False,
-                "error": f"OAuth validation failed: {str(e)}",
-                "mode": "oauth"
-            }
+            return AuthResult(False, mode="oauth", error=f"OAuth validation failed: {str(e)}")
     
-    def check_scope(self, user_scopes: list, required_scope: str) -> bool:
+    def check_scope(self, user_scopes: Collection[str], required_scope: str) -> bool:
         """Check if user has required scope."""
         if not self.enabled:
             return True  # No auth = all scopes allowed
@@ -185,50 +309,42 @@ class UnifiedAuth:
     
     def generate_www_authenticate(self, error: str = None) -> str:
         """Generate WWW-Authenticate header for 401 responses."""
-        parts = [
-            f'realm="{self.config.realm}"',
-            f'resource="{self.config.resource_server_url}"',
-            f'resource_metadata="{self.config.resource_server_url}/.well-known/oauth-protected-resource"'
-        ]
-        
         if error:
-            parts.append(f'error="{error}"')
-            
-        return f"Bearer {', '.join(parts)}"
-
-
-# Singleton instance
-_auth_instance: Optional[UnifiedAuth] = None
+            return self._www_auth_error_fmt.format(error)
+        return self._www_auth_base
 
 
+@functools.lru_cache(maxsize=1)
 def get_auth() -> UnifiedAuth:
     """Get the singleton auth instance."""
-    global _auth_instance
-    if _auth_instance is None:
-        from config import get_auth_config
-        _auth_instance = UnifiedAuth(get_auth_config())
-    return _auth_instance
+    return UnifiedAuth(get_auth_config())
 
 
-async def authenticate_request(token: Optional[str] = None) -> Dict[str, Any]:
+def reset_test_token_cache() -> None:
+    """Re-read MCP_TEST_AUTH_TOKEN from the environment (for tests)."""
+    global _TEST_TOKEN
+    _TEST_TOKEN = os.environ.get('MCP_TEST_AUTH_TOKEN')
+
+
+async def authenticate_request(token: Optional[str] = None) -> AuthResult:
     """Simple function to authenticate a request.
     
     Args:
         token: Bearer token from Authorization header
         
     Returns:
-        Dict with authentication result
+        AuthResult for the token
     """
     auth = get_auth()
     
     # Try to get token from environment if not provided (for testing)
     if not token and auth.enabled:
-        token = os.environ.get('MCP_TEST_AUTH_TOKEN')
+        token = _TEST_TOKEN
     
     return await auth.validate_token(token)
 
 
-async def require_scope(token: Optional[str], required_scope: str) -> Dict[str, Any]:
+async def require_scope(token: Optional[str], required_scope: str) -> AuthResult:
     """Authenticate and check for required scope.
     
     Args:
@@ -236,26 +352,24 @@ async def require_scope(token: Optional[str], required_scope: str) -> Dict[str,
         required_scope: Required scope string
         
     Returns:
-        Dict with authentication result and scope check
+        AuthResult of the successful authentication
         
     Raises:
         HTTPException: If authentication fails or scope missing
     """
-    from fastapi import HTTPException
-    
     # Authenticate
     result = await authenticate_request(token)
     
-    if not result["authenticated"]:
+    if not result.authenticated:
         raise HTTPException(
             status_code=401,
-            detail=result.get("error", "Authentication failed"),
+            detail=result.error or "Authentication failed",
             headers={"WWW-Authenticate": get_auth().generate_www_authenticate("invalid_token")}
         )
     
     # Check scope
     auth = get_auth()
-    if not auth.check_scope(result.get("scopes", []), required_scope):
+    if not auth.check_scope(result.scopes, required_scope):
         raise HTTPException(
             status_code=403,
             detail=f"Missing required scope: {required_scope}"
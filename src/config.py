@@ -1,12 +1,21 @@
 """Configuration management for ServiceNow MCP Server."""
 
+import functools
+import logging
 import os
-from typing import Optional
+import sys
+from typing import FrozenSet, Optional, Tuple
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def ensure_env_loaded() -> None:
+    """Load variables from .env into the process environment (once)."""
+    load_dotenv()
 
 
 class ServiceNowConfig(BaseSettings):
@@ -47,6 +56,11 @@ class ServiceNowConfig(BaseSettings):
         description="API request timeout in seconds"
     )
     
+    connect_timeout: float = Field(
+        5.0,
+        description="Timeout in seconds for opening a new connection"
+    )
+    
     max_retries: int = Field(
         3,
         description="Maximum number of retry attempts for failed requests"
@@ -57,6 +71,16 @@ class ServiceNowConfig(BaseSettings):
         description="Verify SSL certificates"
     )
     
+    max_connections: int = Field(
+        100,
+        description="Maximum concurrent connections to the ServiceNow instance"
+    )
+    
+    max_keepalive_connections: int = Field(
+        20,
+        description="Idle connections kept open for reuse between requests"
+    )
+    
     @field_validator("base_url")
     @classmethod
     def validate_base_url(cls, v: str) -> str:
@@ -65,17 +89,17 @@ class ServiceNowConfig(BaseSettings):
             raise ValueError("base_url must start with http:// or https://")
         return v.rstrip("/")
     
-    @property
+    @functools.cached_property
     def api_base_path(self) -> str:
         """Construct the full API base path."""
         return f"{self.base_url}/api/{self.api_namespace}/{self.api_version}"
     
-    @property
+    @functools.cached_property
     def incident_endpoint(self) -> str:
         """Get the incident endpoint URL."""
         return f"{self.api_base_path}/itsm/incident"
     
-    @property
+    @functools.cached_property
     def oauth_token_url(self) -> str:
         """Get the OAuth token endpoint URL."""
         if self.token_endpoint:
@@ -108,6 +132,11 @@ class ServerConfig(BaseSettings):
         description="Enable debug mode"
     )
     
+    response_cache_ttl: float = Field(
+        30.0,
+        description="Seconds get_incident/get_change_request responses are cached (0 disables)"
+    )
+    
     model_config = {
         "env_file": ".env",
         "case_sensitive": False,
@@ -116,21 +145,24 @@ class ServerConfig(BaseSettings):
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_servicenow_config() -> ServiceNowConfig:
-    """Get ServiceNow configuration instance."""
-    import logging
+    """Get the ServiceNow configuration, loaded once per process."""
+    ensure_env_loaded()
     
     # Debug environment variables
-    servicenow_vars = {k: v for k, v in os.environ.items() if k.startswith('SERVICENOW_')}
-    logging.info(f"Found ServiceNow environment variables: {list(servicenow_vars.keys())}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Found ServiceNow environment variables: %s",
+                     [k for k in os.environ if k.startswith('SERVICENOW_')])
     
     # Check if required variables are present
-    required_vars = ['SERVICENOW_BASE_URL', 'SERVICENOW_CLIENT_ID', 'SERVICENOW_CLIENT_SECRET']
+    required_vars = ('SERVICENOW_BASE_URL', 'SERVICENOW_CLIENT_ID', 'SERVICENOW_CLIENT_SECRET')
     missing_vars = [var for var in required_vars if var not in os.environ]
     
     if missing_vars:
-        logging.error(f"Missing required environment variables: {missing_vars}")
-        logging.info(f"Available environment variables: {list(os.environ.keys())}")
+        logger.error("Missing required environment variables: %s", missing_vars)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Available environment variables: %s", list(os.environ))
     
     return ServiceNowConfig()
 
@@ -258,17 +290,37 @@ class MCPAuthConfig(BaseSettings):
         description="Valid mock tokens for testing"
     )
     
-    @property
-    def all_scopes(self) -> list[str]:
+    @field_validator(
+        "incident_read_scope", "incident_write_scope",
+        "change_request_read_scope", "change_request_write_scope",
+        "incident_task_read_scope", "incident_task_write_scope"
+    )
+    @classmethod
+    def intern_scope(cls, v: str) -> str:
+        """Intern scope names so comparisons against them can short-circuit on identity."""
+        return sys.intern(v)
+    
+    @functools.cached_property
+    def mock_tokens_set(self) -> FrozenSet[str]:
+        """Get mock tokens as a set for constant-time lookups."""
+        return frozenset(self.mock_tokens)
+    
+    @functools.cached_property
+    def all_scopes(self) -> Tuple[str, ...]:
         """Get all ServiceNow MCP scopes."""
-        return [
+        return (
             self.incident_read_scope,
             self.incident_write_scope,
             self.change_request_read_scope,
             self.change_request_write_scope,
             self.incident_task_read_scope,
             self.incident_task_write_scope
-        ]
+        )
+    
+    @functools.cached_property
+    def all_scopes_set(self) -> FrozenSet[str]:
+        """Get all ServiceNow MCP scopes as a set for membership checks."""
+        return frozenset(self.all_scopes)
     
     model_config = {
         "env_file": ".env",
@@ -278,11 +330,15 @@ class MCPAuthConfig(BaseSettings):
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_server_config() -> ServerConfig:
-    """Get server configuration instance."""
+    """Get the server configuration, loaded once per process."""
+    ensure_env_loaded()
     return ServerConfig()
 
 
+@functools.lru_cache(maxsize=1)
 def get_auth_config() -> MCPAuthConfig:
-    """Get authentication configuration instance."""
+    """Get the authentication configuration, loaded once per process."""
+    ensure_env_loaded()
     return MCPAuthConfig()
\ No newline at end of file
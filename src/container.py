@@ -1,6 +1,6 @@
 """Dependency injection container for ServiceNow MCP Server."""
 
-import asyncio
+import functools
 from typing import Optional
 import logging
 
@@ -23,41 +23,50 @@ class ServiceContainer:
         self._incident_tools: Optional[IncidentTools] = None
         self._change_request_tools: Optional[ChangeRequestTools] = None
         self._incident_task_tools: Optional[IncidentTaskTools] = None
-        self._client_lock = asyncio.Lock()
+    
+    def _ensure_client(self) -> ServiceNowClient:
+        """Return the client, creating it on first use.
         
-    async def get_client(self) -> ServiceNowClient:
-        """Get or create ServiceNow client instance."""
+        Construction is synchronous, so there is no await between the check
+        and the assignment and concurrent callers on the event loop always
+        see a single instance without needing a lock.
+        """
         if self._client is None:
-            async with self._client_lock:
-                if self._client is None:
-                    logger.debug("Creating new ServiceNow client instance")
-                    self._client = ServiceNowClient(self._config)
+            logger.debug("Creating new ServiceNow client instance")
+            self._client = ServiceNowClient(self._config)
         return self._client
     
+    async def get_client(self) -> ServiceNowClient:
+        """Get or create ServiceNow client instance."""
+        return self._ensure_client()
+    
     async def get_incident_tools(self) -> IncidentTools:
         """Get or create incident tools instance."""
         if self._incident_tools is None:
-            client = await self.get_client()
-            self._incident_tools = IncidentTools(client)
+            self._incident_tools = IncidentTools(self._ensure_client())
             logger.debug("Created incident tools instance")
         return self._incident_tools
     
     async def get_change_request_tools(self) -> ChangeRequestTools:
         """Get or create change request tools instance."""
         if self._change_request_tools is None:
-            client = await self.get_client()
-            self._change_request_tools = ChangeRequestTools(client)
+            self._change_request_tools = ChangeRequestTools(self._ensure_client())
             logger.debug("Created change request tools instance")
         return self._change_request_tools
     
     async def get_incident_task_tools(self) -> IncidentTaskTools:
         """Get or create incident task tools instance."""
         if self._incident_task_tools is None:
-            client = await self.get_client()
-            self._incident_task_tools = IncidentTaskTools(client)
+            self._incident_task_tools = IncidentTaskTools(self._ensure_client())
             logger.debug("Created incident task tools instance")
         return self._incident_task_tools
     
+    async def warmup(self) -> None:
+        """Create the client and every tool instance ahead of the first request."""
+        await self.get_incident_tools()
+        await self.get_change_request_tools()
+        await self.get_incident_task_tools()
+    
     async def close(self) -> None:
         """Close all service instances and cleanup resources."""
         if self._client:
@@ -71,21 +80,14 @@ class ServiceContainer:
         self._incident_task_tools = None
 
 
-# Global container instance
-_container: Optional[ServiceContainer] = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_container() -> ServiceContainer:
     """Get the global service container instance."""
-    global _container
-    if _container is None:
-        _container = ServiceContainer()
-    return _container
+    return ServiceContainer()
 
 
 async def cleanup_container() -> None:
     """Cleanup the global container and all its resources."""
-    global _container
-    if _container:
-        await _container.close()
-        _container = None
\ No newline at end of file
+    if get_container.cache_info().currsize:
+        await get_container().close()
+        get_container.cache_clear()
\ No newline at end of file
@@ -1,42 +1,80 @@
 """ServiceNow MCP Server built with FastMCP - Modular Version."""
 
+import functools
 import logging
 import signal
 import sys
-from typing import Optional
-
-from fastmcp import FastMCP
-
-from container import get_container, cleanup_container
-from registry import register_all_tools
-from routes.health import health_check
-from routes import oauth
-from auth.simple_middleware import SimpleAuthMiddleware
-from auth.unified_auth import get_auth
-from config import get_auth_config
-
-# Setup logging
-logging.basicConfig(
-    level=logging.DEBUG,  # Temporarily enable debug logging 
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import asyncio
+    
+    from fastmcp import FastMCP
+
+# Thread/process fields are never formatted, so skip collecting them
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logger = logging.getLogger(__name__)
 
+# Chatty third-party loggers capped at WARNING unless --debug is given
+_NOISY_LOGGERS = ("httpx", "httpcore", "urllib3", "asyncio")
+
+# Signals that ask the main process to shut down
+_SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+@functools.lru_cache(maxsize=2)
+def _custom_routes(include_oauth: bool) -> Tuple[Tuple[str, List[str], Callable], ...]:
+    """Build the (path, methods, handler) table of HTTP routes once per variant."""
+    from routes.health import health_check
+    
+    routes = (("/health", ["GET"], health_check),)
+    if not include_oauth:
+        return routes
+    
+    from routes import oauth
+    
+    return routes + (
+        ("/.well-known/oauth-protected-resource", ["GET"], oauth.protected_resource_metadata),
+        ("/.well-known/oauth-authorization-server", ["GET"], oauth.authorization_server_metadata),
+        ("/oauth/clients/{client_id}", ["GET"], oauth.client_id_metadata_document),
+        ("/oauth/register", ["POST"], oauth.dynamic_client_registration),
+        ("/oauth/authorize", ["GET"], oauth.oauth_authorize),
+        ("/oauth/token", ["POST"], oauth.oauth_token),
+        ("/oauth/userinfo", ["GET"], oauth.oauth_userinfo),
+    )
+
 
-def create_server() -> FastMCP:
-    """Create and configure the FastMCP server."""
+def create_server(enable_oauth_routes: Optional[bool] = None) -> "FastMCP":
+    """Create and configure the FastMCP server.
+    
+    Args:
+        enable_oauth_routes: Register the OAuth discovery, registration and
+            token endpoints. Defaults to whether authentication is enabled;
+            pass False for a plain server with only the health check.
+    """
+    # Heavy imports are deferred so --help and argument errors stay fast
+    from fastmcp import FastMCP
+    
+    from auth.unified_auth import get_auth
+    from registry import register_all_tools
+    
     # Initialize simplified authentication
     auth = get_auth()
-    auth_config = get_auth_config()
+    auth_config = auth.config
     
     if auth.enabled:
-        logger.info(f"[SERVER] Authentication ENABLED - mode: {auth.mode}")
-        logger.info(f"[SERVER] JWKS URI: {auth_config.identity_jwks_uri}")
-        logger.info(f"[SERVER] API Identifier: {auth_config.api_identifier}")
+        logger.info("[SERVER] Authentication ENABLED - mode: %s", auth.mode)
+        logger.info("[SERVER] JWKS URI: %s", auth_config.identity_jwks_uri)
+        logger.info("[SERVER] API Identifier: %s", auth_config.api_identifier)
         logger.info("[SERVER] Simplified authentication initialized successfully")
     else:
         logger.info("[SERVER] Authentication DISABLED - all requests will be allowed")
     
+    if enable_oauth_routes is None:
+        enable_oauth_routes = auth.enabled
+    
     server = FastMCP(
         name="servicenow-mcp",
         instructions="ServiceNow MCP server for incident management and API integration",
@@ -46,17 +84,9 @@ def create_server() -> FastMCP:
     # Note: Middleware disabled due to FastMCP compatibility issues
     logger.info("Authentication middleware disabled for FastMCP compatibility")
     
-    # Register health check route
-    server.custom_route("/health", methods=["GET"])(health_check)
-    
-    # Register OAuth routes (per MCP OAuth specification)
-    server.custom_route("/.well-known/oauth-protected-resource", methods=["GET"])(oauth.protected_resource_metadata)
-    server.custom_route("/.well-known/oauth-authorization-server", methods=["GET"])(oauth.authorization_server_metadata)
-    server.custom_route("/oauth/clients/{client_id}", methods=["GET"])(oauth.client_id_metadata_document)
-    server.custom_route("/oauth/register", methods=["POST"])(oauth.dynamic_client_registration)
-    server.custom_route("/oauth/authorize", methods=["GET"])(oauth.oauth_authorize)
-    server.custom_route("/oauth/token", methods=["POST"])(oauth.oauth_token)
-    server.custom_route("/oauth/userinfo", methods=["GET"])(oauth.oauth_userinfo)
+    # Register health check and, if enabled, OAuth routes (per MCP OAuth specification)
+    for path, methods, handler in _custom_routes(enable_oauth_routes):
+        server.custom_route(path, methods=methods)(handler)
     
     # Register all MCP tools
     register_all_tools(server)
@@ -66,39 +96,107 @@ def create_server() -> FastMCP:
 
 
 def setup_signal_handlers() -> None:
-    """Setup signal handlers for graceful shutdown."""
-    def signal_handler(signum, frame):
-        logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-        # Cleanup will be handled by the main function
-        sys.exit(0)
+    """Setup signal handlers for graceful shutdown.
+    
+    Worker processes ignore SIGINT/SIGTERM and leave shutdown to their
+    parent. The main process handles them on its event loop instead; see
+    _install_shutdown_handlers().
+    """
+    import multiprocessing
+    
+    if multiprocessing.parent_process() is not None:
+        for signum in _SHUTDOWN_SIGNALS:
+            signal.signal(signum, signal.SIG_IGN)
+
+
+def _install_shutdown_handlers(shutdown: "asyncio.Event") -> None:
+    """Set shutdown when SIGINT/SIGTERM arrives, without interrupting running code.
     
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    The handlers only flag the event; _amain() watches it and stops the
+    server from a normal code path. Repeated signals are ignored.
+    """
+    import asyncio
+    
+    loop = asyncio.get_running_loop()
+    
+    def request_shutdown(signum: int) -> None:
+        if shutdown.is_set():
+            return
+        logger.info("Received signal %s, initiating graceful shutdown...", signum)
+        shutdown.set()
+    
+    for signum in _SHUTDOWN_SIGNALS:
+        try:
+            loop.add_signal_handler(signum, request_shutdown, signum)
+        except NotImplementedError:
+            # Event loops without add_signal_handler (Windows): hand the
+            # signal over to the loop thread from a plain handler
+            signal.signal(
+                signum,
+                lambda sig, frame: loop.call_soon_threadsafe(request_shutdown, sig)
+            )
 
 
-def initialize_services() -> None:
-    """Initialize services during server startup."""
+async def initialize_services() -> None:
+    """Initialize services during server startup.
+    
+    Tool construction, the JWKS download and the first ServiceNow
+    token/TLS handshake run concurrently so the first request pays for none
+    of them.
+    """
+    import asyncio
+    
+    from auth.unified_auth import get_auth
+    from container import get_container
+    
     logger.info("Starting ServiceNow MCP Server...")
     # Pre-initialize the container to validate configuration
     container = get_container()
+    client = await container.get_client()
+    await asyncio.gather(
+        container.warmup(),
+        get_auth().warm_jwks(),
+        client.preconnect()
+    )
     logger.info("Service container initialized")
 
 
 async def cleanup_services() -> None:
     """Cleanup services during shutdown."""
+    from container import cleanup_container
+    
     logger.info("Shutting down ServiceNow MCP Server...")
     await cleanup_container()
     logger.info("Cleanup completed")
 
 
-def main() -> None:
-    """Main entry point for ServiceNow MCP Server."""
+def _stdio_options(args) -> Dict[str, Any]:
+    """stdio takes no transport options."""
+    return {}
+
+
+def _http_options(args) -> Dict[str, Any]:
+    """HTTP and SSE transports bind to the requested host and port."""
+    return {"host": args.host, "port": args.port}
+
+
+# Transport name -> builder for its run_async() keyword arguments
+_TRANSPORT_OPTIONS = {
+    "stdio": _stdio_options,
+    "http": _http_options,
+    "sse": _http_options,
+}
+
+
+@functools.cache
+def _build_parser():
+    """Build the command-line parser once per process."""
     import argparse
     
     parser = argparse.ArgumentParser(description="ServiceNow FastMCP Server")
     parser.add_argument(
         "--transport", 
-        choices=["stdio", "http", "sse"], 
+        choices=[sys.intern(name) for name in _TRANSPORT_OPTIONS], 
         default="http",
         help="Transport protocol to use (default: http)"
     )
@@ -106,55 +204,109 @@ def main() -> None:
     parser.add_argument("--port", type=int, default=8000, help="Port for HTTP/SSE")
     parser.add_argument("--no-banner", action="store_true", help="Disable startup banner")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    return parser
+
+
+async def _amain(args) -> None:
+    """Initialize services, run the server and clean up on one event loop.
     
-    args = parser.parse_args()
+    The server runs as a task raced against the shutdown event, so a
+    SIGINT/SIGTERM cancels it and cleanup runs on the normal path below.
+    """
+    import asyncio
     
-    # Configure debug logging if requested
+    shutdown = asyncio.Event()
+    _install_shutdown_handlers(shutdown)
+    
+    try:
+        # Initialize services
+        await initialize_services()
+        
+        # Create server
+        server = create_server()
+        
+        if shutdown.is_set():
+            return
+        
+        logger.info("Starting server with transport: %s", args.transport)
+        if args.transport in ["http", "sse"]:
+            logger.info("Server will be available at %s://%s:%d", args.transport, args.host, args.port)
+        
+        # Run the server until it exits or a shutdown signal arrives
+        server_task = asyncio.create_task(server.run_async(
+            transport=args.transport,
+            show_banner=not args.no_banner,
+            **_TRANSPORT_OPTIONS[args.transport](args)
+        ))
+        shutdown_task = asyncio.create_task(shutdown.wait())
+        await asyncio.wait({server_task, shutdown_task}, return_when=asyncio.FIRST_COMPLETED)
+        
+        if server_task.done():
+            shutdown_task.cancel()
+            server_task.result()
+        else:
+            logger.info("Stopping server...")
+            server_task.cancel()
+            try:
+                await server_task
+            except asyncio.CancelledError:
+                pass
+    finally:
+        # Ensure cleanup happens
+        try:
+            await cleanup_services()
+        except Exception as e:
+            logger.error("Error during shutdown: %s", e)
+
+
+def _install_uvloop() -> None:
+    """Run the server on uvloop when it is installed."""
+    import asyncio
+    
+    if sys.platform == "win32":
+        # uvloop has no Windows support; keep the default proactor loop
+        return
+    
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using the default asyncio event loop")
+        return
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
+
+
+def main() -> None:
+    """Main entry point for ServiceNow MCP Server."""
+    import asyncio
+    
+    args = _build_parser().parse_args()
+    
+    # Setup logging once the requested level is known
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     if args.debug:
-        logging.getLogger().setLevel(logging.DEBUG)
         logger.debug("Debug logging enabled")
+    else:
+        for name in _NOISY_LOGGERS:
+            logging.getLogger(name).setLevel(logging.WARNING)
     
     # Setup signal handlers
     setup_signal_handlers()
-    
-    # Initialize services
-    initialize_services()
-    
-    # Create server
-    server = create_server()
+    _install_uvloop()
     
     try:
-        logger.info(f"Starting server with transport: {args.transport}")
-        if args.transport in ["http", "sse"]:
-            logger.info(f"Server will be available at {args.transport}://{args.host}:{args.port}")
-        
-        # Run the server
-        if args.transport == "stdio":
-            server.run(
-                transport=args.transport,
-                show_banner=not args.no_banner
-            )
-        else:
-            # HTTP and SSE transports
-            server.run(
-                transport=args.transport,
-                host=args.host,
-                port=args.port,
-                show_banner=not args.no_banner
-            )
-        
+        # Startup, serving and cleanup share one event loop so clients
+        # created during startup are closed on the loop that owns them
+        asyncio.run(_amain(args))
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         raise
-    finally:
-        # Ensure cleanup happens
-        import asyncio
-        try:
-            asyncio.run(cleanup_services())
-        except Exception as e:
-            logger.error(f"Error during shutdown: {e}")
 
 
 if __name__ == "__main__":
@@ -1,18 +1,106 @@
 """Simplified MCP tool handlers for change request management."""
 
+import asyncio
+import io
 import logging
-from typing import Optional
+from operator import itemgetter
+from typing import List, Optional
 
 from auth.decorators import requires_scope
-from config import get_auth_config
+from config import get_auth_config, get_server_config
 from container import get_container
+from handlers.utils import (
+    ERROR_PREFIX,
+    SEARCH_HEADER_TPL,
+    SEPARATOR,
+    ResponseCache,
+    log_tool_error,
+    pack_params,
+    tool_error_boundary,
+)
 from tools.change_request_tools import format_change_request_display, get_change_request_fields_info
 
 logger = logging.getLogger(__name__)
 auth_config = get_auth_config()
 
+# Response of list_change_request_fields; the field reference never changes
+_CHANGE_REQUEST_FIELDS_TEXT = get_change_request_fields_info()
+
+# Footer shown when more change requests match than the requested page holds
+_SEARCH_NEXT_PAGE_TPL = (
+    "\n\nNote: More change requests match. Use offset={offset} to fetch the next page,"
+    "\nor more specific search criteria to narrow results."
+)
+
+# Formatted get_change_request responses keyed by change request number
+_change_request_cache = ResponseCache(512, get_server_config().response_cache_ttl)
+
+# Change request fetches get_change_requests keeps in flight at once, and accepts per call
+_BULK_FETCH_CONCURRENCY = 5
+_BULK_FETCH_MAX_NUMBERS = 50
+
+# Largest page search_change_requests fetches and formats
+_SEARCH_MAX_LIMIT = 100
+
+# Tool parameters forwarded to the tools layer, in signature order
+_SEARCH_CHANGE_REQUEST_KEYS = (
+    "active",
+    "requested_by",
+    "agreement_id",
+    "company",
+    "category",
+    "cmdb_ci",
+    "type",
+    "priority",
+    "risk",
+    "impact",
+    "state",
+    "assignment_group",
+    "assigned_to",
+)
+
+_UPDATE_CHANGE_REQUEST_KEYS = (
+    "company_name",
+    "description",
+    "comments",
+    "on_hold",
+    "on_hold_reason",
+    "resolved",
+    "customer_reference_id",
+)
+
+# Search result rows: one block per change request, following SEARCH_HEADER_TPL.
+# Only these columns are requested from ServiceNow.
+_CHANGE_REQUEST_ROW_FIELDS = (
+    "number",
+    "state",
+    "type",
+    "priority",
+    "risk",
+    "requested_by",
+    "company",
+    "short_description",
+    "assignment_group",
+)
+
+# Reads every row column in one call; raises KeyError if ServiceNow omitted one
+_change_request_row_values = itemgetter(*_CHANGE_REQUEST_ROW_FIELDS)
+
+_CHANGE_REQUEST_ROW_TPL = (
+    "\n\n{}. {}"
+    "\n   State: {}"
+    "\n   Type: {}"
+    "\n   Priority: {}"
+    "\n   Risk: {}"
+    "\n   Requested By: {}"
+    "\n   Company: {}"
+    "\n   Short Description: {}"
+    "\n   Assignment Group: {}"
+)
+
 
 @requires_scope(auth_config.change_request_read_scope)
+@tool_error_boundary("searching change requests")
 async def search_change_requests(
     active: bool = True,
     requested_by: Optional[str] = None,
@@ -26,7 +114,9 @@ async def search_change_requests(
     impact: Optional[int] = None,
     state: Optional[int] = None,
     assignment_group: Optional[str] = None,
-    assigned_to: Optional[str] = None
+    assigned_to: Optional[str] = None,
+    limit: int = 10,
+    offset: int = 0
 ) -> str:
     """Search change request records based on query parameters.
     
@@ -47,6 +137,8 @@ async def search_change_requests(
         state: Search by state (1=New, 2=Assess, 3=Authorize, 4=Scheduled, 5=Implement, 6=Review, 7=Closed, 8=Canceled)
         assignment_group: Search by Assignment Group
         assigned_to: Search by assigned user
+        limit: Maximum number of change requests to return (default 10, at most 100)
+        offset: Number of matching change requests to skip, for paging (default 0)
         
     Returns:
         Formatted list of matching change requests or error message
@@ -54,108 +146,96 @@ async def search_change_requests(
     
     logger.info("Searching change requests with specified criteria")
     
-    try:
-        container = get_container()
-        tools = await container.get_change_request_tools()
-        
-        # Build search parameters, filtering out None values
-        search_params = {
-            k: v for k, v in {
-                "active": active,
-                "requested_by": requested_by,
-                "agreement_id": agreement_id,
-                "company": company,
-                "category": category,
-                "cmdb_ci": cmdb_ci,
-                "type": type,
-                "priority": priority,
-                "risk": risk,
-                "impact": impact,
-                "state": state,
-                "assignment_group": assignment_group,
-                "assigned_to": assigned_to,
-            }.items() if v is not None
-        }
+    if not 1 <= limit <= _SEARCH_MAX_LIMIT or offset < 0:
+        return f"{ERROR_PREFIX}limit must be between 1 and {_SEARCH_MAX_LIMIT} and offset must not be negative."
+    
+    container = get_container()
+    tools = await container.get_change_request_tools()
+    
+    # Build search parameters, filtering out None values
+    search_params = pack_params(_SEARCH_CHANGE_REQUEST_KEYS, (
+        active,
+        requested_by,
+        agreement_id,
+        company,
+        category,
+        cmdb_ci,
+        type,
+        priority,
+        risk,
+        impact,
+        state,
+        assignment_group,
+        assigned_to,
+    ))
+    
+    # One extra change request is fetched to tell whether another page exists
+    result = await tools.search_change_requests(
+        fields=_CHANGE_REQUEST_ROW_FIELDS, limit=limit + 1, offset=offset, **search_params
+    )
+    
+    # Debug logging to understand the result type and content
+    logger.debug("Search result type: %s", type(result))
+    logger.debug("Search result content: %s", result)
+    
+    # Handle case where result is not a dictionary
+    if not isinstance(result, dict):
+        logger.error("Expected dict result but got %s: %s", type(result), result)
+        return f"Error: Unexpected result format from search_change_requests. Expected dict but got {type(result)}"
+    
+    # Check for errors in the response
+    if "error" in result:
+        error_msg = log_tool_error(logger, result, "searching change requests")
+        return ERROR_PREFIX + error_msg
+    
+    # Format success response
+    if result.get("success"):
+        change_requests = result.get("change_requests", [])
+        count = result.get("count", 0)
+        search_criteria = result.get("search_criteria", {})
+        message = result.get("message", f"Found {count} change requests")
         
-        result = await tools.search_change_requests(**search_params)
+        if count == 0:
+            return f"No change requests found matching the search criteria.\n\nSearch Parameters:\n{search_criteria}"
         
-        # Debug logging to understand the result type and content
-        logger.debug(f"Search result type: {type(result)}")
-        logger.debug(f"Search result content: {result}")
+        more = count > limit
+        if more:
+            count = f"{limit}+"
+            message = f"Found more than {limit} change requests matching search criteria"
         
-        # Handle case where result is not a dictionary
-        if not isinstance(result, dict):
-            logger.error(f"Expected dict result but got {type(result)}: {result}")
-            return f"Error: Unexpected result format from search_change_requests. Expected dict but got {type(result)}"
+        # Format search results
+        buf = io.StringIO()
+        buf.write(SEARCH_HEADER_TPL.format(
+            message=message, criteria=search_criteria, count=count, noun="change request"
+        ))
         
-        # Check for errors in the response
-        if "error" in result:
-            error_msg = result["error"]
-            error_type = result.get("error_type", "unknown")
-            
-            if error_type == "validation_error":
-                logger.warning(f"Validation error searching change requests: {error_msg}")
+        # Show summary of each change request
+        for i, cr in enumerate(change_requests[:limit], offset + 1):
+            # Handle case where change request might be a string instead of dict
+            if isinstance(cr, str):
+                buf.write(f"\n\n{i}. {cr}\n   Note: Change request data returned as string format")
+            elif isinstance(cr, dict):
+                try:
+                    values = _change_request_row_values(cr)
+                except KeyError:
+                    values = [cr.get(field, 'N/A') for field in _CHANGE_REQUEST_ROW_FIELDS]
+                buf.write(_CHANGE_REQUEST_ROW_TPL.format(i, *values))
             else:
-                logger.error(f"Error searching change requests: {error_msg}")
-            
-            return f"Error: {error_msg}"
+                buf.write(f"\n\n{i}. {str(cr)}\n   Note: Unexpected change request data format: {type(cr)}")
         
-        # Format success response
-        if result.get("success"):
-            change_requests = result.get("change_requests", [])
-            count = result.get("count", 0)
-            search_criteria = result.get("search_criteria", {})
-            message = result.get("message", f"Found {count} change requests")
-            
-            if count == 0:
-                return f"No change requests found matching the search criteria.\n\nSearch Parameters:\n{search_criteria}"
-            
-            # Format search results
-            lines = [f"Search Results: {message}"]
-            lines.append("=" * 60)
-            lines.append(f"Search Criteria: {search_criteria}")
-            lines.append(f"Found {count} change request(s):")
-            lines.append("=" * 60)
-            
-            # Show summary of each change request
-            for i, cr in enumerate(change_requests[:10], 1):  # Limit to first 10 for readability
-                # Handle case where change request might be a string instead of dict
-                if isinstance(cr, str):
-                    lines.append(f"\n{i}. {cr}")
-                    lines.append(f"   Note: Change request data returned as string format")
-                elif isinstance(cr, dict):
-                    lines.append(f"\n{i}. {cr.get('number', 'N/A')}")
-                    lines.append(f"   State: {cr.get('state', 'N/A')}")
-                    lines.append(f"   Type: {cr.get('type', 'N/A')}")
-                    lines.append(f"   Priority: {cr.get('priority', 'N/A')}")
-                    lines.append(f"   Risk: {cr.get('risk', 'N/A')}")
-                    lines.append(f"   Requested By: {cr.get('requested_by', 'N/A')}")
-                    lines.append(f"   Company: {cr.get('company', 'N/A')}")
-                    lines.append(f"   Short Description: {cr.get('short_description', 'N/A')}")
-                    lines.append(f"   Assignment Group: {cr.get('assignment_group', 'N/A')}")
-                else:
-                    lines.append(f"\n{i}. {str(cr)}")
-                    lines.append(f"   Note: Unexpected change request data format: {type(cr)}")
-            
-            if count > 10:
-                lines.append(f"\n... and {count - 10} more change requests")
-                lines.append("\nNote: Only showing first 10 change requests for readability.")
-                lines.append("Use more specific search criteria to narrow results.")
-            
-            response = "\n".join(lines)
-            logger.info(f"Successfully found {count} change requests")
-            return response
-        else:
-            return "Error: Search failed"
+        if more:
+            buf.write("\n\n... and more change requests")
+            buf.write(_SEARCH_NEXT_PAGE_TPL.format(offset=offset + limit))
         
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        logger.error(f"Unexpected error searching change requests: {e}")
-        return f"Error: {error_msg}"
-
+        response = buf.getvalue()
+        logger.info("Successfully found %s change requests", count)
+        return response
+    else:
+        return f"{ERROR_PREFIX}Search failed"
 
 
 @requires_scope(auth_config.change_request_read_scope)
+@tool_error_boundary("fetching change request", "changerequest_number")
 async def get_change_request(changerequest_number: str) -> str:
     """Get change request record details by change request number.
     
@@ -175,36 +255,64 @@ async def get_change_request(changerequest_number: str) -> str:
         - Technical information (CMDB CI, conflict status)
         - Work notes and comments
     """
-    logger.info(f"Fetching change request details for: {changerequest_number}")
+    logger.info("Fetching change request details for: %s", changerequest_number)
     
-    try:
-        container = get_container()
-        tools = await container.get_change_request_tools()
-        changerequest_data = await tools.get_change_request(changerequest_number)
-        
-        # Check for errors in the response
-        if "error" in changerequest_data:
-            error_msg = changerequest_data["error"]
-            error_type = changerequest_data.get("error_type", "unknown")
-            
-            if error_type == "not_found":
-                logger.warning(f"Change request {changerequest_number} not found")
-            else:
-                logger.error(f"Error fetching change request {changerequest_number}: {error_msg}")
-            
-            return f"Error: {error_msg}"
-        
-        # Format the change request data for display
-        formatted_result = format_change_request_display(changerequest_data["changerequest"])
-        logger.info(f"Successfully retrieved change request data for: {changerequest_number}")
-        
-        return formatted_result
-        
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        logger.error(f"Unexpected error fetching change request {changerequest_number}: {e}")
-        return f"Error: {error_msg}"
+    cached = _change_request_cache.get(changerequest_number)
+    if cached is not None:
+        logger.debug("Serving change request %s from response cache", changerequest_number)
+        return cached
+    
+    container = get_container()
+    tools = await container.get_change_request_tools()
+    changerequest_data = await tools.get_change_request(changerequest_number)
+    
+    # Check for errors in the response
+    if "error" in changerequest_data:
+        error_msg = log_tool_error(logger, changerequest_data, f"fetching change request {changerequest_number}")
+        return ERROR_PREFIX + error_msg
+    
+    # Format the change request data for display
+    formatted_result = format_change_request_display(changerequest_data["changerequest"])
+    _change_request_cache.set(changerequest_number, formatted_result)
+    logger.info("Successfully retrieved change request data for: %s", changerequest_number)
+    
+    return formatted_result
+
 
+@requires_scope(auth_config.change_request_read_scope)
+async def get_change_requests(changerequest_numbers: List[str]) -> str:
+    """Get the details of several change requests in one call.
+    
+    Change requests are fetched concurrently, a few at a time, and one
+    failing lookup does not stop the others.
+    
+    Args:
+        changerequest_numbers: The change request numbers, at most 50 (e.g., ["CHG0035060", "CHG0035061"])
+        
+    Returns:
+        Formatted details of each change request, or its error message, in the order given
+    """
+    # Drop repeated numbers, keeping the first occurrence's position
+    numbers = list(dict.fromkeys(changerequest_numbers))
+    logger.info("Fetching %d change requests", len(numbers))
+    
+    if not numbers:
+        return f"{ERROR_PREFIX}No change request numbers provided."
+    if len(numbers) > _BULK_FETCH_MAX_NUMBERS:
+        return f"{ERROR_PREFIX}At most {_BULK_FETCH_MAX_NUMBERS} change requests can be fetched per call."
+    
+    semaphore = asyncio.Semaphore(_BULK_FETCH_CONCURRENCY)
+    
+    async def fetch_one(changerequest_number: str) -> str:
+        async with semaphore:
+            return await get_change_request(changerequest_number)
+    
+    results = await asyncio.gather(*(fetch_one(number) for number in numbers))
+    
+    return "\n\n".join(
+        f"{SEPARATOR}\n{number}\n{SEPARATOR}\n{result}"
+        for number, result in zip(numbers, results, strict=True)
+    )
 
 
 @requires_scope(auth_config.change_request_read_scope)
@@ -214,11 +322,11 @@ async def list_change_request_fields() -> str:
     Returns:
         Formatted list of change request fields with descriptions and examples
     """
-    return get_change_request_fields_info()
-
+    return _CHANGE_REQUEST_FIELDS_TEXT
 
 
 @requires_scope(auth_config.change_request_write_scope)
+@tool_error_boundary("updating change request", "changerequest_number")
 async def update_change_request(
     changerequest_number: str,
     company_name: str,
@@ -248,71 +356,55 @@ async def update_change_request(
         Success message with updated change request details or error message
     """
     
-    logger.info(f"Updating change request: {changerequest_number}")
+    logger.info("Updating change request: %s", changerequest_number)
     
-    try:
-        container = get_container()
-        tools = await container.get_change_request_tools()
-        
-        # Build update parameters, filtering out None values
-        update_params = {
-            k: v for k, v in {
-                "company_name": company_name,
-                "description": description,
-                "comments": comments,
-                "on_hold": on_hold,
-                "on_hold_reason": on_hold_reason,
-                "resolved": resolved,
-                "customer_reference_id": customer_reference_id,
-            }.items() if v is not None
-        }
-        
-        result = await tools.update_change_request(changerequest_number, **update_params)
-        
-        # Handle case where result is not a dictionary
-        if not isinstance(result, dict):
-            logger.error(f"Expected dict result but got {type(result)}: {result}")
-            return f"Error: Unexpected result format from update_change_request. Expected dict but got {type(result)}"
-        
-        # Check for errors in the response
-        if "error" in result:
-            error_msg = result["error"]
-            error_type = result.get("error_type", "unknown")
-            
-            if error_type == "not_found":
-                logger.warning(f"Change request {changerequest_number} not found for update")
-            elif error_type == "validation_error":
-                logger.warning(f"Validation error updating change request {changerequest_number}: {error_msg}")
-            else:
-                logger.error(f"Error updating change request {changerequest_number}: {error_msg}")
-            
-            return f"Error: {error_msg}"
+    container = get_container()
+    tools = await container.get_change_request_tools()
+    
+    # Build update parameters, filtering out None values
+    update_params = pack_params(_UPDATE_CHANGE_REQUEST_KEYS, (
+        company_name,
+        description,
+        comments,
+        on_hold,
+        on_hold_reason,
+        resolved,
+        customer_reference_id,
+    ))
+    
+    result = await tools.update_change_request(changerequest_number, **update_params)
+    
+    # Handle case where result is not a dictionary
+    if not isinstance(result, dict):
+        logger.error("Expected dict result but got %s: %s", type(result), result)
+        return f"Error: Unexpected result format from update_change_request. Expected dict but got {type(result)}"
+    
+    # Check for errors in the response
+    if "error" in result:
+        error_msg = log_tool_error(logger, result, f"updating change request {changerequest_number}")
+        return ERROR_PREFIX + error_msg
+    
+    # Format success response
+    if result.get("success"):
+        _change_request_cache.invalidate(changerequest_number)
+        updated_changerequest = result.get("updated_changerequest", {})
+        message = result.get("message", f"Change request {changerequest_number} updated successfully")
         
-        # Format success response
-        if result.get("success"):
-            updated_changerequest = result.get("updated_changerequest", {})
-            message = result.get("message", f"Change request {changerequest_number} updated successfully")
-            
-            # Format the updated change request data for display
-            if updated_changerequest:
-                formatted_result = format_change_request_display(updated_changerequest)
-                response = f"{message}\n\nUpdated Change Request Details:\n{formatted_result}"
-            else:
-                response = message
-            
-            logger.info(f"Successfully updated change request: {changerequest_number}")
-            return response
+        # Format the updated change request data for display
+        if updated_changerequest:
+            formatted_result = format_change_request_display(updated_changerequest)
+            response = f"{message}\n\nUpdated Change Request Details:\n{formatted_result}"
         else:
-            return f"Error: Update failed for change request {changerequest_number}"
+            response = message
         
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        logger.error(f"Unexpected error updating change request {changerequest_number}: {e}")
-        return f"Error: {error_msg}"
-
+        logger.info("Successfully updated change request: %s", changerequest_number)
+        return response
+    else:
+        return f"Error: Update failed for change request {changerequest_number}"
 
 
 @requires_scope(auth_config.change_request_write_scope)
+@tool_error_boundary("processing approval for change request", "changerequest_number")
 async def approve_change_request(
     changerequest_number: str,
     state: str,
@@ -341,62 +433,52 @@ async def approve_change_request(
         - The approval is recorded with timestamp and approver details
     """
     
-    logger.info(f"Processing {state} for change request: {changerequest_number}")
+    logger.info("Processing %s for change request: %s", state, changerequest_number)
     
-    try:
-        container = get_container()
-        tools = await container.get_change_request_tools()
-        
-        result = await tools.approve_change_request(
-            changerequest_number=changerequest_number,
-            state=state,
-            approver_email=approver_email,
-            approver_name=approver_name,
-            on_behalf=on_behalf
-        )
-        
-        # Handle case where result is not a dictionary
-        if not isinstance(result, dict):
-            logger.error(f"Expected dict result but got {type(result)}: {result}")
-            return f"Error: Unexpected result format from approve_change_request. Expected dict but got {type(result)}"
-        
-        # Check for errors in the response
-        if "error" in result:
-            error_msg = result["error"]
-            error_type = result.get("error_type", "unknown")
-            
-            if error_type == "not_found":
-                logger.warning(f"Change request {changerequest_number} not found for approval")
-            elif error_type == "validation_error":
-                logger.warning(f"Validation error approving change request {changerequest_number}: {error_msg}")
-            else:
-                logger.error(f"Error approving change request {changerequest_number}: {error_msg}")
-            
-            return f"Error: {error_msg}"
+    container = get_container()
+    tools = await container.get_change_request_tools()
+    
+    result = await tools.approve_change_request(
+        changerequest_number=changerequest_number,
+        state=state,
+        approver_email=approver_email,
+        approver_name=approver_name,
+        on_behalf=on_behalf
+    )
+    
+    # Handle case where result is not a dictionary
+    if not isinstance(result, dict):
+        logger.error("Expected dict result but got %s: %s", type(result), result)
+        return f"Error: Unexpected result format from approve_change_request. Expected dict but got {type(result)}"
+    
+    # Check for errors in the response
+    if "error" in result:
+        error_msg = log_tool_error(logger, result, f"approving change request {changerequest_number}")
+        return ERROR_PREFIX + error_msg
+    
+    # Format success response
+    if result.get("success"):
+        _change_request_cache.invalidate(changerequest_number)
+        approval_state = result.get("approval_state", state)
+        approver = result.get("approver_email", approver_email)
+        message = result.get("message", f"Change request {changerequest_number} has been {approval_state}")
         
-        # Format success response
-        if result.get("success"):
-            approval_state = result.get("approval_state", state)
-            approver = result.get("approver_email", approver_email)
-            message = result.get("message", f"Change request {changerequest_number} has been {approval_state}")
-            
-            response = f"{message}\n\n"
-            response += "=" * 60 + "\n"
-            response += f"Change Request: {changerequest_number}\n"
-            response += f"Approval State: {approval_state.upper()}\n"
-            response += f"Approved By: {approver}\n"
-            if approver_name:
-                response += f"Approver Name: {approver_name}\n"
-            if on_behalf:
-                response += f"On Behalf Of: {on_behalf}\n"
-            response += "=" * 60
-            
-            logger.info(f"Successfully {approval_state} change request: {changerequest_number}")
-            return response
-        else:
-            return f"Error: Approval failed for change request {changerequest_number}"
+        parts = [
+            message,
+            "",
+            SEPARATOR,
+            f"Change Request: {changerequest_number}",
+            f"Approval State: {approval_state.upper()}",
+            f"Approved By: {approver}",
+        ]
+        if approver_name:
+            parts.append(f"Approver Name: {approver_name}")
+        if on_behalf:
+            parts.append(f"On Behalf Of: {on_behalf}")
+        parts.append(SEPARATOR)
+        response = "\n".join(parts)
         
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        logger.error(f"Unexpected error processing approval for change request {changerequest_number}: {e}")
-        return f"Error: {error_msg}"
\ No newline at end of file
+        logger.info("Successfully %s change request: %s", approval_state, changerequest_number)
+        return response
+    else:
+        return f"Error: Approval failed for change request {changerequest_number}"
@@ -1,18 +1,93 @@
 """Simplified MCP tool handlers for incident management."""
 
+import io
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional
 
+from api import ServiceNowAPIError, ServiceNowNotFoundError, ServiceNowValidationError
 from auth.decorators import requires_scope, optional_auth
-from config import get_auth_config
+from config import get_auth_config, get_server_config
 from container import get_container
+from handlers.utils import (
+    ERROR_PREFIX,
+    SEARCH_FOOTER_TPL,
+    SEARCH_HEADER_TPL,
+    ResponseCache,
+    get_job_result,
+    pack_params,
+    submit_job,
+    tool_error_boundary,
+)
 from tools.incident_tools import format_incident_display, get_incident_fields_info
 
 logger = logging.getLogger(__name__)
 auth_config = get_auth_config()
 
+# Response of list_incident_fields; the field reference never changes
+_INCIDENT_FIELDS_TEXT = get_incident_fields_info()
+
+# Formatted get_incident responses keyed by incident number
+_incident_cache = ResponseCache(512, get_server_config().response_cache_ttl)
+
+# Tool parameters forwarded to the tools layer, in signature order
+_UPDATE_INCIDENT_KEYS = (
+    "state",
+    "impact",
+    "urgency",
+    "category",
+    "subcategory",
+    "short_description",
+    "description",
+    "holdreason",
+    "service_impacting",
+    "comments",
+    "notes",
+    "customer_reference_id",
+)
+
+_SEARCH_INCIDENT_KEYS = (
+    "active",
+    "requested_by",
+    "company",
+    "service_name",
+    "category",
+    "subcategory",
+    "configuration_item",
+    "state",
+    "priority",
+    "assignment_group",
+    "assigned_to",
+)
+
+# Incidents shown by search_incidents; one extra is fetched to tell whether more match
+_SEARCH_DISPLAY_LIMIT = 10
+_SEARCH_FOOTER = SEARCH_FOOTER_TPL.format(limit=_SEARCH_DISPLAY_LIMIT, noun="incident")
+
+# Search result rows: one block per incident, following SEARCH_HEADER_TPL.
+# Only these columns are requested from ServiceNow.
+_INCIDENT_ROW_FIELDS = (
+    "number",
+    "state",
+    "priority",
+    "requested_by",
+    "company",
+    "short_description",
+    "assignment_group",
+)
+
+_INCIDENT_ROW_TPL = (
+    "\n\n{}. {}"
+    "\n   State: {}"
+    "\n   Priority: {}"
+    "\n   Requested By: {}"
+    "\n   Company: {}"
+    "\n   Short Description: {}"
+    "\n   Assignment Group: {}"
+)
+
 
 @requires_scope(auth_config.incident_read_scope)
+@tool_error_boundary("fetching incident", "incident_number")
 async def get_incident(
     incident_number: str
 ) -> str:
@@ -33,35 +108,31 @@ async def get_incident(
         - Resolution information (if resolved)
         - Comments and notes
     """
-    logger.info(f"Fetching incident details for: {incident_number}")
+    logger.info("Fetching incident details for: %s", incident_number)
+    
+    cached = _incident_cache.get(incident_number)
+    if cached is not None:
+        logger.debug("Serving incident %s from response cache", incident_number)
+        return cached
     
     try:
         container = get_container()
         tools = await container.get_incident_tools()
         incident_data = await tools.get_incident(incident_number)
         
-        # Check for errors in the response
-        if "error" in incident_data:
-            error_msg = incident_data["error"]
-            error_type = incident_data.get("error_type", "unknown")
-            
-            if error_type == "not_found":
-                logger.warning(f"Incident {incident_number} not found")
-            else:
-                logger.error(f"Error fetching incident {incident_number}: {error_msg}")
-            
-            return f"Error: {error_msg}"
-        
         # Format the incident data for display
         formatted_result = format_incident_display(incident_data)
-        logger.info(f"Successfully retrieved incident data for: {incident_number}")
+        _incident_cache.set(incident_number, formatted_result)
+        logger.info("Successfully retrieved incident data for: %s", incident_number)
         
         return formatted_result
         
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        logger.error(f"Unexpected error fetching incident {incident_number}: {e}")
-        return f"Error: {error_msg}"
+    except ServiceNowNotFoundError as e:
+        logger.warning("Incident %s not found", incident_number)
+        return f"{ERROR_PREFIX}{e}"
+    except ServiceNowAPIError as e:
+        logger.error("Error fetching incident %s: %s", incident_number, e)
+        return f"{ERROR_PREFIX}{e}"
 
 
 @requires_scope(auth_config.incident_read_scope)
@@ -71,7 +142,7 @@ async def list_incident_fields() -> str:
     Returns:
         Formatted list of incident fields with descriptions and examples
     """
-    return get_incident_fields_info()
+    return _INCIDENT_FIELDS_TEXT
 
 
 @requires_scope(auth_config.incident_write_scope)
@@ -88,7 +159,8 @@ async def update_incident(
     service_impacting: Optional[str] = None,
     comments: Optional[str] = None,
     notes: Optional[str] = None,
-    customer_reference_id: Optional[str] = None
+    customer_reference_id: Optional[str] = None,
+    run_in_background: bool = False
 ) -> str:
     """Update incident record by incident number.
     
@@ -109,74 +181,73 @@ async def update_incident(
         comments: Add comments to incident
         notes: Add notes to incident
         customer_reference_id: Customer ticket ID
+        run_in_background: Return a job id immediately instead of waiting for
+            ServiceNow; fetch the result later with poll_job
         
     Returns:
-        Success message with updated incident details or error message
+        Success message with updated incident details or error message,
+        or the job id to poll when run_in_background is set
     """
-    logger.info(f"Updating incident: {incident_number}")
+    logger.info("Updating incident: %s", incident_number)
+    
+    # Build update parameters, filtering out None values
+    update_params = pack_params(_UPDATE_INCIDENT_KEYS, (
+        state,
+        impact,
+        urgency,
+        category,
+        subcategory,
+        short_description,
+        description,
+        holdreason,
+        service_impacting,
+        comments,
+        notes,
+        customer_reference_id,
+    ))
+    
+    if not update_params:
+        return f"{ERROR_PREFIX}No update fields provided. At least one field must be specified for update."
     
+    update = _update_incident(incident_number, update_params)
+    if run_in_background:
+        return submit_job(update, f"update incident {incident_number}")
+    return await update
+
+
+@tool_error_boundary("updating incident", "incident_number")
+async def _update_incident(incident_number: str, update_params: Dict[str, Any]) -> str:
+    """Apply an incident update and format the tool response."""
     try:
         container = get_container()
         tools = await container.get_incident_tools()
         
-        # Build update parameters, filtering out None values
-        update_params = {
-            k: v for k, v in {
-                "state": state,
-                "impact": impact,
-                "urgency": urgency,
-                "category": category,
-                "subcategory": subcategory,
-                "short_description": short_description,
-                "description": description,
-                "holdreason": holdreason,
-                "service_impacting": service_impacting,
-                "comments": comments,
-                "notes": notes,
-                "customer_reference_id": customer_reference_id,
-            }.items() if v is not None
-        }
-        
-        if not update_params:
-            return "Error: No update fields provided. At least one field must be specified for update."
-        
         result = await tools.update_incident(incident_number, **update_params)
-        
-        # Check for errors in the response
-        if "error" in result:
-            error_msg = result["error"]
-            error_type = result.get("error_type", "unknown")
-            
-            if error_type == "not_found":
-                logger.warning(f"Incident {incident_number} not found for update")
-            elif error_type == "validation_error":
-                logger.warning(f"Validation error updating incident {incident_number}: {error_msg}")
-            else:
-                logger.error(f"Error updating incident {incident_number}: {error_msg}")
-            
-            return f"Error: {error_msg}"
+        _incident_cache.invalidate(incident_number)
         
         # Format success response
-        if result.get("success"):
-            updated_incident = result.get("updated_incident", {})
-            message = result.get("message", f"Incident {incident_number} updated successfully")
-            
-            # Format the updated incident data for display
-            if updated_incident:
-                formatted_result = format_incident_display(updated_incident)
-                response = f"{message}\n\nUpdated Incident Details:\n{formatted_result}"
-            else:
-                response = message
-            
-            logger.info(f"Successfully updated incident: {incident_number}")
-            return response
+        updated_incident = result.updated_incident
+        message = result.message
+        
+        # Format the updated incident data for display
+        if updated_incident:
+            formatted_result = format_incident_display(updated_incident)
+            response = f"{message}\n\nUpdated Incident Details:\n{formatted_result}"
         else:
-            return f"Error: Update failed for incident {incident_number}"
+            response = message
+        
+        logger.info("Successfully updated incident: %s", incident_number)
+        return response
         
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        logger.error(f"Unexpected error updating incident {incident_number}: {e}")
-        return f"Error: {error_msg}"
+    except ServiceNowNotFoundError as e:
+        logger.warning("Incident %s not found for update", incident_number)
+        return f"{ERROR_PREFIX}{e}"
+    except ServiceNowValidationError as e:
+        logger.warning("Validation error updating incident %s: %s", incident_number, e)
+        return f"{ERROR_PREFIX}{e}"
+    except ServiceNowAPIError as e:
+        logger.error("Error updating incident %s: %s", incident_number, e)
+        return f"{ERROR_PREFIX}{e}"
 
 
 @requires_scope(auth_config.incident_write_scope)
@@ -192,7 +263,8 @@ async def create_incident(
     assigned_to: Optional[str] = None,
     assignment_group: Optional[str] = None,
     contact_type: Optional[str] = None,
-    customer_reference_id: Optional[str] = None
+    customer_reference_id: Optional[str] = None,
+    run_in_background: bool = False
 ) -> str:
     """Create a new incident record.
     
@@ -212,68 +284,68 @@ async def create_incident(
         assignment_group: Assignment group
         contact_type: Interface type (e.g., "Self-Service")
         customer_reference_id: Customer ticket ID
+        run_in_background: Return a job id immediately instead of waiting for
+            ServiceNow; fetch the result later with poll_job
         
     Returns:
-        Success message with created incident details or error message
+        Success message with created incident details or error message,
+        or the job id to poll when run_in_background is set
     """
-    logger.info(f"Creating new incident")
+    logger.info("Creating new incident")
     
+    create = _create_incident(
+        short_description=short_description,
+        description=description,
+        service_name=service_name,
+        urgency=urgency,
+        impact=impact,
+        category=category,
+        subcategory=subcategory,
+        configuration_item=configuration_item,
+        assigned_to=assigned_to,
+        assignment_group=assignment_group,
+        contact_type=contact_type,
+        customer_reference_id=customer_reference_id
+    )
+    if run_in_background:
+        return submit_job(create, "create incident")
+    return await create
+
+
+@tool_error_boundary("creating incident")
+async def _create_incident(**create_params: Any) -> str:
+    """Create an incident and format the tool response."""
     try:
         container = get_container()
         tools = await container.get_incident_tools()
         
-        result = await tools.create_incident(
-            short_description=short_description,
-            description=description,
-            service_name=service_name,
-            urgency=urgency,
-            impact=impact,
-            category=category,
-            subcategory=subcategory,
-            configuration_item=configuration_item,
-            assigned_to=assigned_to,
-            assignment_group=assignment_group,
-            contact_type=contact_type,
-            customer_reference_id=customer_reference_id
-        )
-        
-        # Check for errors in the response
-        if "error" in result:
-            error_msg = result["error"]
-            error_type = result.get("error_type", "unknown")
-            
-            if error_type == "validation_error":
-                logger.warning(f"Validation error creating incident: {error_msg}")
-            else:
-                logger.error(f"Error creating incident: {error_msg}")
-            
-            return f"Error: {error_msg}"
+        result = await tools.create_incident(**create_params)
         
         # Format success response
-        if result.get("success"):
-            created_incident = result.get("created_incident", {})
-            incident_number = result.get("incident_number", "Unknown")
-            message = result.get("message", f"Incident {incident_number} created successfully")
-            
-            # Format the created incident data for display
-            if created_incident:
-                formatted_result = format_incident_display(created_incident)
-                response = f"{message}\n\nCreated Incident Details:\n{formatted_result}"
-            else:
-                response = message
-            
-            logger.info(f"Successfully created incident: {incident_number}")
-            return response
+        created_incident = result.created_incident
+        incident_number = result.incident_number
+        message = result.message
+        
+        # Format the created incident data for display
+        if created_incident:
+            formatted_result = format_incident_display(created_incident)
+            response = f"{message}\n\nCreated Incident Details:\n{formatted_result}"
         else:
-            return "Error: Incident creation failed"
+            response = message
+        
+        logger.info("Successfully created incident: %s", incident_number)
+        return response
         
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        logger.error(f"Unexpected error creating incident: {e}")
-        return f"Error: {error_msg}"
+    except ServiceNowValidationError as e:
+        logger.warning("Validation error creating incident: %s", e)
+        return f"{ERROR_PREFIX}{e}"
+    except ServiceNowAPIError as e:
+        logger.error("Error creating incident: %s", e)
+        return f"{ERROR_PREFIX}{e}"
 
 
 @requires_scope(auth_config.incident_read_scope)
+@tool_error_boundary("searching incidents")
 async def search_incidents(
     active: bool = True,
     requested_by: Optional[str] = None,
@@ -308,107 +380,99 @@ async def search_incidents(
     Returns:
         Formatted list of matching incidents or error message
     """
-    logger.info(f"Searching incidents with specified criteria")
+    logger.info("Searching incidents with specified criteria")
     
     try:
         container = get_container()
         tools = await container.get_incident_tools()
         
         # Build search parameters, filtering out None values
-        search_params = {
-            k: v for k, v in {
-                "active": active,
-                "requested_by": requested_by,
-                "company": company,
-                "service_name": service_name,
-                "category": category,
-                "subcategory": subcategory,
-                "configuration_item": configuration_item,
-                "state": state,
-                "priority": priority,
-                "assignment_group": assignment_group,
-                "assigned_to": assigned_to,
-            }.items() if v is not None
-        }
+        search_params = pack_params(_SEARCH_INCIDENT_KEYS, (
+            active,
+            requested_by,
+            company,
+            service_name,
+            category,
+            subcategory,
+            configuration_item,
+            state,
+            priority,
+            assignment_group,
+            assigned_to,
+        ))
         
-        result = await tools.search_incidents(**search_params)
+        result = await tools.search_incidents(
+            fields=_INCIDENT_ROW_FIELDS, limit=_SEARCH_DISPLAY_LIMIT + 1, **search_params
+        )
         
         # Debug logging to understand the result type and content
-        logger.debug(f"Search result type: {type(result)}")
-        logger.debug(f"Search result content: {result}")
+        logger.debug("Search result type: %s", type(result))
+        logger.debug("Search result content: %s", result)
+        
+        # Format success response
+        incidents = result.incidents
+        count = result.count
+        search_criteria = result.search_criteria
+        message = result.message
+        
+        if count == 0:
+            return f"No incidents found matching the search criteria.\n\nSearch Parameters:\n{search_criteria}"
+        
+        more = count > _SEARCH_DISPLAY_LIMIT
+        if more:
+            count = f"{_SEARCH_DISPLAY_LIMIT}+"
+            message = f"Found more than {_SEARCH_DISPLAY_LIMIT} incidents matching search criteria"
         
-        # Handle case where result is not a dictionary
-        if not isinstance(result, dict):
-            logger.error(f"Expected dict result but got {type(result)}: {result}")
-            return f"Error: Unexpected result format from search_incidents. Expected dict but got {type(result)}"
+        # Format search results
+        buf = io.StringIO()
+        buf.write(SEARCH_HEADER_TPL.format(
+            message=message, criteria=search_criteria, count=count, noun="incident"
+        ))
         
-        # Check for errors in the response
-        if "error" in result:
-            error_msg = result["error"]
-            error_type = result.get("error_type", "unknown")
-            
-            if error_type == "validation_error":
-                logger.warning(f"Validation error searching incidents: {error_msg}")
+        # Show summary of each incident
+        for i, incident in enumerate(incidents[:_SEARCH_DISPLAY_LIMIT], 1):
+            # Handle case where incident might be a string instead of dict
+            if isinstance(incident, str):
+                buf.write(f"\n\n{i}. {incident}\n   Note: Incident data returned as string format")
+            elif isinstance(incident, dict):
+                buf.write(_INCIDENT_ROW_TPL.format(
+                    i, *[incident.get(field, 'N/A') for field in _INCIDENT_ROW_FIELDS]
+                ))
             else:
-                logger.error(f"Error searching incidents: {error_msg}")
-            
-            return f"Error: {error_msg}"
+                buf.write(f"\n\n{i}. {str(incident)}\n   Note: Unexpected incident data format: {type(incident)}")
+                
+                # Try to convert to dict if it's another type that might have dict-like properties
+                try:
+                    if hasattr(incident, '__dict__'):
+                        incident_dict = incident.__dict__
+                        buf.write(f"\n   Converted to dict: {incident_dict}")
+                except Exception as e:
+                    buf.write(f"\n   Could not convert to dict: {str(e)}")
         
-        # Format success response
-        if result.get("success"):
-            incidents = result.get("incidents", [])
-            count = result.get("count", 0)
-            search_criteria = result.get("search_criteria", {})
-            message = result.get("message", f"Found {count} incidents")
-            
-            if count == 0:
-                return f"No incidents found matching the search criteria.\n\nSearch Parameters:\n{search_criteria}"
-            
-            # Format search results
-            lines = [f"Search Results: {message}"]
-            lines.append("=" * 60)
-            lines.append(f"Search Criteria: {search_criteria}")
-            lines.append(f"Found {count} incident(s):")
-            lines.append("=" * 60)
-            
-            # Show summary of each incident
-            for i, incident in enumerate(incidents[:10], 1):  # Limit to first 10 for readability
-                # Handle case where incident might be a string instead of dict
-                if isinstance(incident, str):
-                    lines.append(f"\n{i}. {incident}")
-                    lines.append(f"   Note: Incident data returned as string format")
-                elif isinstance(incident, dict):
-                    lines.append(f"\n{i}. {incident.get('number', 'N/A')}")
-                    lines.append(f"   State: {incident.get('state', 'N/A')}")
-                    lines.append(f"   Priority: {incident.get('priority', 'N/A')}")
-                    lines.append(f"   Requested By: {incident.get('requested_by', 'N/A')}")
-                    lines.append(f"   Company: {incident.get('company', 'N/A')}")
-                    lines.append(f"   Short Description: {incident.get('short_description', 'N/A')}")
-                    lines.append(f"   Assignment Group: {incident.get('assignment_group', 'N/A')}")
-                else:
-                    lines.append(f"\n{i}. {str(incident)}")
-                    lines.append(f"   Note: Unexpected incident data format: {type(incident)}")
-                    
-                    # Try to convert to dict if it's another type that might have dict-like properties
-                    try:
-                        if hasattr(incident, '__dict__'):
-                            incident_dict = incident.__dict__
-                            lines.append(f"   Converted to dict: {incident_dict}")
-                    except Exception as e:
-                        lines.append(f"   Could not convert to dict: {str(e)}")
-            
-            if count > 10:
-                lines.append(f"\n... and {count - 10} more incidents")
-                lines.append("\nNote: Only showing first 10 incidents for readability.")
-                lines.append("Use more specific search criteria to narrow results.")
-            
-            response = "\n".join(lines)
-            logger.info(f"Successfully found {count} incidents")
-            return response
-        else:
-            return "Error: Search failed"
+        if more:
+            buf.write("\n\n... and more incidents")
+            buf.write(_SEARCH_FOOTER)
+        
+        response = buf.getvalue()
+        logger.info("Successfully found %s incidents", count)
+        return response
         
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        logger.error(f"Unexpected error searching incidents: {e}")
-        return f"Error: {error_msg}"
\ No newline at end of file
+    except ServiceNowValidationError as e:
+        logger.warning("Validation error searching incidents: %s", e)
+        return f"{ERROR_PREFIX}{e}"
+    except ServiceNowAPIError as e:
+        logger.error("Error searching incidents: %s", e)
+        return f"{ERROR_PREFIX}{e}"
+
+
+@requires_scope(auth_config.incident_read_scope)
+async def poll_job(job_id: str) -> str:
+    """Get the result of a tool call started with run_in_background.
+    
+    Args:
+        job_id: The job id returned by create_incident or update_incident
+        
+    Returns:
+        The tool's response once the job has finished, otherwise its status
+    """
+    return get_job_result(job_id)
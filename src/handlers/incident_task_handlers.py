@@ -1,18 +1,33 @@
 """Simplified MCP tool handlers for incident task management."""
 
+import asyncio
 import logging
-from typing import Optional
+from typing import List, Optional
 
+from api import ServiceNowAPIError, ServiceNowNotFoundError, ServiceNowValidationError
 from auth.decorators import requires_scope
-from config import get_auth_config
+from config import get_auth_config, get_server_config
 from container import get_container
+from handlers.utils import ERROR_PREFIX, ResponseCache, tool_error_boundary
+from models.incident_task import IncidentTaskCreateRequest
 from tools.incident_task_tools import format_incident_task_display, get_incident_task_fields_info
 
 logger = logging.getLogger(__name__)
 auth_config = get_auth_config()
 
+# Response of list_incident_task_fields; the field reference never changes
+_INCIDENT_TASK_FIELDS_TEXT = get_incident_task_fields_info()
+
+# Formatted get_incident_task responses keyed by task number
+_incident_task_cache = ResponseCache(1024, get_server_config().response_cache_ttl)
+
+# Task creations create_incident_tasks keeps in flight at once, and accepts per call
+_BULK_CREATE_CONCURRENCY = 5
+_BULK_CREATE_MAX_TASKS = 50
+
 
 @requires_scope(auth_config.incident_task_read_scope)
+@tool_error_boundary("fetching incident task", "incident_task_number")
 async def get_incident_task(
     incident_task_number: str
 ) -> str:
@@ -34,35 +49,31 @@ async def get_incident_task(
         - Work notes and comments
         - Direct URL to the task in ServiceNow
     """
-    logger.info(f"Fetching incident task details for: {incident_task_number}")
+    logger.info("Fetching incident task details for: %s", incident_task_number)
+    
+    cached = _incident_task_cache.get(incident_task_number)
+    if cached is not None:
+        logger.debug("Serving incident task %s from response cache", incident_task_number)
+        return cached
     
     try:
         container = get_container()
         tools = await container.get_incident_task_tools()
         task_data = await tools.get_incident_task(incident_task_number)
         
-        # Check for errors in the response
-        if "error" in task_data:
-            error_msg = task_data["error"]
-            error_type = task_data.get("error_type", "unknown")
-            
-            if error_type == "not_found":
-                logger.warning(f"Incident task {incident_task_number} not found")
-            else:
-                logger.error(f"Error fetching incident task {incident_task_number}: {error_msg}")
-            
-            return f"Error: {error_msg}"
-        
         # Format the incident task data for display
-        formatted_result = format_incident_task_display(task_data["incident_task"])
-        logger.info(f"Successfully retrieved incident task data for: {incident_task_number}")
+        formatted_result = format_incident_task_display(task_data)
+        _incident_task_cache.set(incident_task_number, formatted_result)
+        logger.info("Successfully retrieved incident task data for: %s", incident_task_number)
         
         return formatted_result
         
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        logger.error(f"Unexpected error fetching incident task {incident_task_number}: {e}")
-        return f"Error: {error_msg}"
+    except ServiceNowNotFoundError as e:
+        logger.warning("Incident task %s not found", incident_task_number)
+        return f"{ERROR_PREFIX}{e}"
+    except ServiceNowAPIError as e:
+        logger.error("Error fetching incident task %s: %s", incident_task_number, e)
+        return f"{ERROR_PREFIX}{e}"
 
 
 @requires_scope(auth_config.incident_task_read_scope)
@@ -72,10 +83,11 @@ async def list_incident_task_fields() -> str:
     Returns:
         Formatted list of incident task fields with descriptions and examples
     """
-    return get_incident_task_fields_info()
+    return _INCIDENT_TASK_FIELDS_TEXT
 
 
 @requires_scope(auth_config.incident_task_write_scope)
+@tool_error_boundary("updating incident task", "incident_task_number")
 async def update_incident_task(
     incident_task_number: str,
     short_description: str,
@@ -102,7 +114,7 @@ async def update_incident_task(
     Returns:
         Success message with updated incident task details or error message
     """
-    logger.info(f"Updating incident task: {incident_task_number}")
+    logger.info("Updating incident task: %s", incident_task_number)
     
     try:
         container = get_container()
@@ -117,50 +129,35 @@ async def update_incident_task(
             assignment_group=assignment_group,
             assigned_to=assigned_to
         )
-        
-        # Handle case where result is not a dictionary
-        if not isinstance(result, dict):
-            logger.error(f"Expected dict result but got {type(result)}: {result}")
-            return f"Error: Unexpected result format from update_incident_task. Expected dict but got {type(result)}"
-        
-        # Check for errors in the response
-        if "error" in result:
-            error_msg = result["error"]
-            error_type = result.get("error_type", "unknown")
-            
-            if error_type == "not_found":
-                logger.warning(f"Incident task {incident_task_number} not found for update")
-            elif error_type == "validation_error":
-                logger.warning(f"Validation error updating incident task {incident_task_number}: {error_msg}")
-            else:
-                logger.error(f"Error updating incident task {incident_task_number}: {error_msg}")
-            
-            return f"Error: {error_msg}"
+        _incident_task_cache.invalidate(incident_task_number)
         
         # Format success response
-        if result.get("success"):
-            updated_task = result.get("updated_incident_task", {})
-            message = result.get("message", f"Incident task {incident_task_number} updated successfully")
-            
-            # Format the updated incident task data for display
-            if updated_task:
-                formatted_result = format_incident_task_display(updated_task)
-                response = f"{message}\n\nUpdated Incident Task Details:\n{formatted_result}"
-            else:
-                response = message
-            
-            logger.info(f"Successfully updated incident task: {incident_task_number}")
-            return response
+        updated_task = result.updated_incident_task
+        message = result.message
+        
+        # Format the updated incident task data for display
+        if updated_task:
+            formatted_result = format_incident_task_display(updated_task)
+            response = f"{message}\n\nUpdated Incident Task Details:\n{formatted_result}"
         else:
-            return f"Error: Update failed for incident task {incident_task_number}"
+            response = message
         
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        logger.error(f"Unexpected error updating incident task {incident_task_number}: {e}")
-        return f"Error: {error_msg}"
+        logger.info("Successfully updated incident task: %s", incident_task_number)
+        return response
+        
+    except ServiceNowNotFoundError as e:
+        logger.warning("Incident task %s not found for update", incident_task_number)
+        return f"{ERROR_PREFIX}{e}"
+    except ServiceNowValidationError as e:
+        logger.warning("Validation error updating incident task %s: %s", incident_task_number, e)
+        return f"{ERROR_PREFIX}{e}"
+    except ServiceNowAPIError as e:
+        logger.error("Error updating incident task %s: %s", incident_task_number, e)
+        return f"{ERROR_PREFIX}{e}"
 
 
 @requires_scope(auth_config.incident_task_write_scope)
+@tool_error_boundary("creating incident task")
 async def create_incident_task(
     incident_number: str,
     short_description: str,
@@ -191,7 +188,7 @@ async def create_incident_task(
     Returns:
         Success message with created incident task details or error message
     """
-    logger.info(f"Creating new incident task")
+    logger.info("Creating new incident task")
     
     try:
         container = get_container()
@@ -209,42 +206,82 @@ async def create_incident_task(
             assigned_to=assigned_to
         )
         
-        # Handle case where result is not a dictionary
-        if not isinstance(result, dict):
-            logger.error(f"Expected dict result but got {type(result)}: {result}")
-            return f"Error: Unexpected result format from create_incident_task. Expected dict but got {type(result)}"
-        
-        # Check for errors in the response
-        if "error" in result:
-            error_msg = result["error"]
-            error_type = result.get("error_type", "unknown")
-            
-            if error_type == "validation_error":
-                logger.warning(f"Validation error creating incident task: {error_msg}")
-            else:
-                logger.error(f"Error creating incident task: {error_msg}")
-            
-            return f"Error: {error_msg}"
-        
         # Format success response
-        if result.get("success"):
-            created_task = result.get("created_incident_task", {})
-            task_number = result.get("task_number", "Unknown")
-            message = result.get("message", f"Incident task {task_number} created successfully")
-            
-            # Format the created incident task data for display
-            if created_task:
-                formatted_result = format_incident_task_display(created_task)
-                response = f"{message}\n\nCreated Incident Task Details:\n{formatted_result}"
-            else:
-                response = message
-            
-            logger.info(f"Successfully created incident task: {task_number}")
-            return response
+        created_task = result.created_incident_task
+        task_number = result.task_number
+        message = result.message
+        
+        # Format the created incident task data for display
+        if created_task:
+            formatted_result = format_incident_task_display(created_task)
+            response = f"{message}\n\nCreated Incident Task Details:\n{formatted_result}"
         else:
-            return "Error: Incident task creation failed"
+            response = message
+        
+        logger.info("Successfully created incident task: %s", task_number)
+        return response
+        
+    except ServiceNowValidationError as e:
+        logger.warning("Validation error creating incident task: %s", e)
+        return f"{ERROR_PREFIX}{e}"
+    except ServiceNowAPIError as e:
+        logger.error("Error creating incident task: %s", e)
+        return f"{ERROR_PREFIX}{e}"
+
+
+@requires_scope(auth_config.incident_task_write_scope)
+@tool_error_boundary("creating incident tasks")
+async def create_incident_tasks(
+    tasks: List[IncidentTaskCreateRequest]
+) -> str:
+    """Create several incident task records in one call.
+    
+    Each task takes the same fields as create_incident_task. Tasks are
+    created concurrently, a few at a time, and one failing task does not
+    stop the others.
+    
+    Args:
+        tasks: Incident tasks to create (at most 50)
         
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        logger.error(f"Unexpected error creating incident task: {e}")
-        return f"Error: {error_msg}"
\ No newline at end of file
+    Returns:
+        Summary with the created task number or error message for each task
+    """
+    logger.info("Creating %d incident tasks", len(tasks))
+    
+    if not tasks:
+        return f"{ERROR_PREFIX}No incident tasks provided."
+    if len(tasks) > _BULK_CREATE_MAX_TASKS:
+        return f"{ERROR_PREFIX}At most {_BULK_CREATE_MAX_TASKS} incident tasks can be created per call."
+    
+    container = get_container()
+    tools = await container.get_incident_task_tools()
+    
+    semaphore = asyncio.Semaphore(_BULK_CREATE_CONCURRENCY)
+    
+    async def create_one(task: IncidentTaskCreateRequest) -> str:
+        async with semaphore:
+            try:
+                result = await tools.create_incident_task(**task.model_dump())
+            except ServiceNowValidationError as e:
+                logger.warning("Validation error creating incident task for %s: %s", task.incident_number, e)
+                return f"{ERROR_PREFIX}{e}"
+            except ServiceNowAPIError as e:
+                logger.error("Error creating incident task for %s: %s", task.incident_number, e)
+                return f"{ERROR_PREFIX}{e}"
+            except Exception as e:
+                logger.error(
+                    "Unexpected error creating incident task for %s: %s",
+                    task.incident_number, e, exc_info=True
+                )
+                return f"{ERROR_PREFIX}Unexpected error: {str(e)}"
+        return f"Created {result.task_number}"
+    
+    outcomes = await asyncio.gather(*(create_one(task) for task in tasks))
+    
+    created = sum(not outcome.startswith(ERROR_PREFIX) for outcome in outcomes)
+    lines = [f"Created {created} of {len(tasks)} incident tasks"]
+    for i, (task, outcome) in enumerate(zip(tasks, outcomes, strict=True), 1):
+        lines.append(f"{i}. {task.incident_number} - {task.short_description}: {outcome}")
+    
+    logger.info("Created %d of %d incident tasks", created, len(tasks))
+    return "\n".join(lines)
@@ -2,6 +2,7 @@
 
 import logging
 from typing import Optional
+from api import ServiceNowAPIError
 from container import get_container
 
 logger = logging.getLogger(__name__)
@@ -29,10 +30,10 @@ async def incident_analysis_prompt(
         # Get incident data using existing tools
         container = get_container()
         tools = await container.get_incident_tools()
-        incident_data = await tools.get_incident(incident_number)
-        
-        if "error" in incident_data:
-            return f"Error: Could not fetch incident {incident_number} - {incident_data['error']}"
+        try:
+            incident_data = await tools.get_incident(incident_number)
+        except ServiceNowAPIError as e:
+            return f"Error: Could not fetch incident {incident_number} - {e}"
         
         # Format incident data for prompt
         from tools.incident_tools import format_incident_display
@@ -132,12 +133,12 @@ async def daily_incidents_summary_prompt(
             search_params["assignment_group"] = assignment_group
         
         # Search for incidents
-        result = await tools.search_incidents(**search_params)
-        
-        if "error" in result:
-            return f"Error searching incidents: {result['error']}"
+        try:
+            result = await tools.search_incidents(**search_params)
+        except ServiceNowAPIError as e:
+            return f"Error searching incidents: {e}"
         
-        incidents_summary = f"""Found {result.get('count', 0)} incidents matching criteria:
+        incidents_summary = f"""Found {result.count} incidents matching criteria:
 - Active: True
 - State: {state if state else 'All'}
 - Priority: {priority if priority else 'All'}
@@ -147,7 +148,7 @@ async def daily_incidents_summary_prompt(
 """
         
         # Add incident summaries
-        for i, incident in enumerate(result.get('incidents', [])[:20], 1):
+        for i, incident in enumerate(result.incidents[:20], 1):
             if isinstance(incident, dict):
                 incidents_summary += f"""
 ### {i}. {incident.get('number', 'N/A')}
@@ -173,7 +174,7 @@ async def daily_incidents_summary_prompt(
 
 Provide data-driven insights and specific recommendations."""
         
-        logger.info(f"Successfully generated summary prompt for {result.get('count', 0)} incidents")
+        logger.info(f"Successfully generated summary prompt for {result.count} incidents")
         return prompt
         
     except Exception as e:
@@ -270,19 +271,19 @@ async def automation_suggestions_prompt() -> str:
         tools = await container.get_incident_tools()
         
         # Get recent resolved incidents to analyze patterns
-        result = await tools.search_incidents(state=6, active=False)  # State 6 = Resolved
-        
-        if "error" in result:
-            return f"Error searching incidents: {result['error']}"
+        try:
+            result = await tools.search_incidents(state=6, active=False)  # State 6 = Resolved
+        except ServiceNowAPIError as e:
+            return f"Error searching incidents: {e}"
         
-        incident_patterns = f"""Analyzed {result.get('count', 0)} recently resolved incidents.
+        incident_patterns = f"""Analyzed {result.count} recently resolved incidents.
 
 ## Common Incident Categories:
 """
         
         # Group incidents by category
         categories = {}
-        for incident in result.get('incidents', [])[:50]:
+        for incident in result.incidents[:50]:
             if isinstance(incident, dict):
                 cat = incident.get('category', 'Unknown')
                 if cat not in categories:
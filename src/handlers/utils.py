@@ -0,0 +1,226 @@
+"""Shared helpers for MCP tool handlers."""
+
+import asyncio
+import functools
+import inspect
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Coroutine, Dict, Hashable, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds a finished background job stays available to poll_job
+JOB_RETENTION_SECONDS = 600.0
+
+# Prefix of every tool response that reports a failure
+ERROR_PREFIX = "Error: "
+
+# Rule framing the header blocks of tool responses
+SEPARATOR = "=" * 60
+
+# Header of the search tool responses; each matching record follows as its own block
+SEARCH_HEADER_TPL = (
+    "Search Results: {message}\n"
+    + SEPARATOR + "\n"
+    "Search Criteria: {criteria}\n"
+    "Found {count} {noun}(s):\n"
+    + SEPARATOR
+)
+
+# Closing note of search responses that show only the first {limit} matches
+SEARCH_FOOTER_TPL = (
+    "\n\nNote: Only showing first {limit} {noun}s for readability."
+    "\nUse more specific search criteria to narrow results."
+)
+
+
+def log_tool_error(log: logging.Logger, result: Dict[str, Any], action: str) -> str:
+    """Log an error result from the tools layer at the level its type calls for.
+    
+    Args:
+        log: Logger of the calling handler module
+        result: Tools-layer result carrying "error" and optionally "error_type"
+        action: What failed, e.g. "updating change request CHG0035060"
+        
+    Returns:
+        The error message, for the tool response
+    """
+    error_msg = result["error"]
+    match result.get("error_type", "unknown"):
+        case "not_found":
+            log.warning("Not found %s: %s", action, error_msg)
+        case "validation_error":
+            log.warning("Validation error %s: %s", action, error_msg)
+        case _:
+            log.error("Error %s: %s", action, error_msg)
+    return error_msg
+
+
+def tool_error_boundary(action: str, key: Optional[str] = None) -> Callable:
+    """Decorator turning unexpected exceptions of a tool handler into an error response.
+    
+    Errors the handler reports itself pass through untouched; anything it
+    raises is logged with its traceback on the handler module's logger.
+    
+    Usage:
+        @tool_error_boundary("updating change request", "changerequest_number")
+        async def update_change_request(changerequest_number: str, ...) -> str:
+            # Handler implementation
+    
+    Args:
+        action: What the handler does, for the log message
+        key: Parameter naming the record the handler works on, appended to action in the log
+    """
+    def decorator(func: Callable) -> Callable:
+        log = logging.getLogger(func.__module__)
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                target = action
+                if key is not None:
+                    bound = signature.bind_partial(*args, **kwargs)
+                    target = f"{action} {bound.arguments.get(key)}"
+                log.error("Unexpected error %s: %s", target, e, exc_info=True)
+                return f"{ERROR_PREFIX}Unexpected error: {str(e)}"
+        
+        return wrapper
+    return decorator
+
+
+def pack_params(keys: Tuple[str, ...], values: Iterable[Any]) -> Dict[str, Any]:
+    """Pair parameter names with their values, dropping those left as None.
+    
+    Args:
+        keys: Parameter names, in the same order as values
+        values: Parameter values
+        
+    Returns:
+        Dict of the parameters that were provided
+    """
+    return {k: v for k, v in zip(keys, values, strict=True) if v is not None}
+
+
+class ResponseCache:
+    """Small LRU cache of formatted tool responses with a fixed time-to-live.
+    
+    Used by the single-record read tools so that repeated reads of the same
+    record within a conversation skip the ServiceNow round-trip. A TTL of 0
+    disables caching.
+    """
+    
+    __slots__ = ("_entries", "_maxsize", "_ttl")
+    
+    def __init__(self, maxsize: int, ttl: float):
+        # key -> (response, monotonic expiry)
+        self._entries: "OrderedDict[Hashable, Tuple[str, float]]" = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+    
+    def get(self, key: Hashable) -> Optional[str]:
+        """Return the cached response for key, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        response, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return response
+    
+    def set(self, key: Hashable, response: str) -> None:
+        """Cache response under key, evicting the least recently used entry when full."""
+        if self._ttl <= 0:
+            return
+        
+        self._entries[key] = (response, time.monotonic() + self._ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self, key: Hashable) -> None:
+        """Drop any cached response for key."""
+        self._entries.pop(key, None)
+
+
+@dataclass(slots=True)
+class _Job:
+    """A tool call running in the background."""
+    
+    task: "asyncio.Task[str]"
+    description: str
+    finished_at: Optional[float] = None
+
+
+_jobs: Dict[str, _Job] = {}
+
+
+def _sweep_jobs() -> None:
+    """Forget jobs that finished more than JOB_RETENTION_SECONDS ago."""
+    cutoff = time.monotonic() - JOB_RETENTION_SECONDS
+    expired = [job_id for job_id, job in _jobs.items()
+               if job.finished_at is not None and job.finished_at < cutoff]
+    for job_id in expired:
+        del _jobs[job_id]
+
+
+def submit_job(coro: Coroutine[Any, Any, str], description: str) -> str:
+    """Run a tool body in the background and return a message with its job id.
+    
+    Args:
+        coro: Coroutine producing the tool's response text
+        description: Short description of the work, shown by poll_job
+        
+    Returns:
+        Message telling the caller which job id to pass to poll_job
+    """
+    _sweep_jobs()
+    
+    job_id = uuid.uuid4().hex
+    job = _Job(asyncio.create_task(coro), description)
+    
+    def _mark_finished(_task: "asyncio.Task[str]") -> None:
+        job.finished_at = time.monotonic()
+    
+    job.task.add_done_callback(_mark_finished)
+    _jobs[job_id] = job
+    logger.info("Started background job %s: %s", job_id, description)
+    
+    return (f"Job {job_id} started: {description}.\n"
+            f"Call poll_job with job_id \"{job_id}\" to get the result.")
+
+
+def get_job_result(job_id: str) -> str:
+    """Report the status of a background job, or its response once finished.
+    
+    Args:
+        job_id: Job id returned by submit_job
+        
+    Returns:
+        The job's response text if it has finished, otherwise a status message
+    """
+    _sweep_jobs()
+    
+    job = _jobs.get(job_id)
+    if job is None:
+        return f"{ERROR_PREFIX}Unknown or expired job id {job_id}"
+    
+    task = job.task
+    if not task.done():
+        return f"Job {job_id} is still running: {job.description}"
+    if task.cancelled():
+        return f"{ERROR_PREFIX}Job {job_id} was cancelled"
+    
+    exc = task.exception()
+    if exc is not None:
+        return f"{ERROR_PREFIX}Job {job_id} failed: {exc}"
+    return task.result()
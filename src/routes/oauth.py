@@ -1,5 +1,6 @@
 """OAuth authentication routes for MCP server."""
 
+import functools
 import json
 import logging
 from typing import Dict, Any, Optional
@@ -11,40 +12,64 @@ from config import get_auth_config
 logger = logging.getLogger(__name__)
 oauth_provider = OAuthProvider()
 
+# Well-known metadata is static for the lifetime of the process
+_METADATA_HEADERS = {"Cache-Control": "public, max-age=3600"}
 
-async def protected_resource_metadata(request: Request) -> JSONResponse:
+_BEARER_PREFIX = "Bearer "
+_BEARER_LEN = len(_BEARER_PREFIX)
+
+
+@functools.lru_cache(maxsize=None)
+def _metadata_json(document: str) -> bytes:
+    """Serialize a well-known metadata document once and reuse the bytes.
+    
+    Args:
+        document: Either "protected_resource" or "authorization_server"
+        
+    Returns:
+        UTF-8 encoded JSON body, formatted the same way as JSONResponse
+    """
+    if document == "protected_resource":
+        metadata = oauth_provider.get_protected_resource_metadata()
+    else:
+        metadata = oauth_provider.get_authorization_server_metadata()
+    
+    return json.dumps(
+        metadata,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+async def protected_resource_metadata(request: Request) -> Response:
     """Return Protected Resource Metadata (PRM) document.
     
     This endpoint provides metadata about the protected resource
     as defined in RFC 8707.
     """
-    metadata = oauth_provider.get_protected_resource_metadata()
     logger.info("Served protected resource metadata")
     
-    return JSONResponse(
-        content=metadata,
-        headers={
-            "Content-Type": "application/json",
-            "Cache-Control": "public, max-age=3600"
-        }
+    return Response(
+        content=_metadata_json("protected_resource"),
+        media_type="application/json",
+        headers=_METADATA_HEADERS
     )
 
 
-async def authorization_server_metadata(request: Request) -> JSONResponse:
+async def authorization_server_metadata(request: Request) -> Response:
     """Return Authorization Server Metadata document.
     
     This endpoint provides metadata about the authorization server
     as defined in RFC 8414.
     """
-    metadata = oauth_provider.get_authorization_server_metadata()
     logger.info("Served authorization server metadata")
     
-    return JSONResponse(
-        content=metadata,
-        headers={
-            "Content-Type": "application/json",
-            "Cache-Control": "public, max-age=3600"
-        }
+    return Response(
+        content=_metadata_json("authorization_server"),
+        media_type="application/json",
+        headers=_METADATA_HEADERS
     )
 
 
@@ -280,10 +305,10 @@ async def oauth_userinfo(request: Request) -> JSONResponse:
     """
     # Extract Bearer token
     auth_header = request.headers.get("Authorization", "")
-    if not auth_header.startswith("Bearer "):
+    if not auth_header.startswith(_BEARER_PREFIX):
         raise HTTPException(status_code=401, detail="Bearer token required")
     
-    token = auth_header[7:]  # Remove "Bearer " prefix
+    token = auth_header[_BEARER_LEN:]
     
     try:
         # Validate and decode token (simplified)
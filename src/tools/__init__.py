@@ -1,6 +1,17 @@
 """ServiceNow MCP tools module."""
 
-from .incident_tools import IncidentTools
+from .incident_tools import (
+    IncidentCreateResult,
+    IncidentSearchResult,
+    IncidentTools,
+    IncidentUpdateResult,
+)
 from .change_request_tools import ChangeRequestTools
 
-__all__ = ["IncidentTools", "ChangeRequestTools"]
\ No newline at end of file
+__all__ = [
+    "IncidentTools",
+    "IncidentUpdateResult",
+    "IncidentCreateResult",
+    "IncidentSearchResult",
+    "ChangeRequestTools",
+]
\ No newline at end of file
@@ -1,7 +1,8 @@
 """Change request management tools for ServiceNow MCP Server."""
 
+import functools
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
 from api.client import ServiceNowClient
 from models.change_request import ChangeRequestSearchRequest, ChangeRequestResponse, ChangeRequestUpdateRequest
 
@@ -33,7 +34,10 @@ class ChangeRequestTools:
         impact: Optional[int] = None,
         state: Optional[int] = None,
         assignment_group: Optional[str] = None,
-        assigned_to: Optional[str] = None
+        assigned_to: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
     ) -> Dict[str, Any]:
         """Search change request records based on criteria.
         
@@ -51,6 +55,9 @@ class ChangeRequestTools:
             state: Search by Change Request's state (1-8)
             assignment_group: Search by Assignment Group
             assigned_to: Search by Assigned user details
+            fields: Columns to fetch for each change request; all columns if None
+            limit: Maximum number of change requests to fetch; all matches if None
+            offset: Number of matching change requests to skip
             
         Returns:
             Dictionary containing search results or error information
@@ -81,7 +88,7 @@ class ChangeRequestTools:
             logger.info(f"Searching change requests with criteria: {search_params}")
             
             # Perform the search
-            result = await self.client.search_change_requests(search_params)
+            result = await self.client.search_change_requests(search_params, fields, limit, offset)
             
             # Debug logging to understand the response format
             logger.debug(f"Search results type: {type(result)}")
@@ -330,18 +337,14 @@ class ChangeRequestTools:
             # Build approval data dictionary
             approval_data = approval_request.model_dump(exclude_none=True)
             
-            # Call the API client to approve/reject the change request
-            response = await self.client.approve_change_request(
+            # Call the API client to approve/reject the change request; the
+            # endpoint checks the Authorize state and records the decision in
+            # one request, so there is no separate read beforehand
+            await self.client.approve_change_request(
                 changerequest_number,
                 approval_data
             )
             
-            # Check if response indicates success
-            if response and not isinstance(response, dict):
-                response = {"result": response}
-            
-            result = response.get("result", response)
-            
             logger.info(f"Successfully {state} change request: {changerequest_number}")
             
             return {
@@ -486,24 +489,48 @@ def format_change_request_display(change_request: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+# Display labels for the numeric choice fields
+_CHANGE_STATE_LABELS = {
+    1: "New",
+    2: "Assess",
+    3: "Authorize",
+    4: "Scheduled",
+    5: "Implement",
+    6: "Review",
+    7: "Closed",
+    8: "Canceled"
+}
+
+_PRIORITY_LABELS = {
+    1: "Critical",
+    2: "High",
+    3: "Medium",
+    4: "Low"
+}
+
+_RISK_LABELS = {
+    1: "Very Low",
+    2: "Low",
+    3: "Medium",
+    4: "High",
+    5: "Very High"
+}
+
+_IMPACT_LABELS = {
+    1: "Critical",
+    2: "High",
+    3: "Medium",
+    4: "Low"
+}
+
+
 def _format_change_state(state: Any) -> str:
     """Format change request state for display."""
     if state is None:
         return "N/A"
     
-    state_map = {
-        1: "New",
-        2: "Assess",
-        3: "Authorize",
-        4: "Scheduled",
-        5: "Implement",
-        6: "Review",
-        7: "Closed",
-        8: "Canceled"
-    }
-    
     state_int = int(state) if str(state).isdigit() else None
-    return state_map.get(state_int, f"Unknown ({state})")
+    return _CHANGE_STATE_LABELS.get(state_int, f"Unknown ({state})")
 
 
 def _format_priority(priority: Any) -> str:
@@ -511,15 +538,8 @@ def _format_priority(priority: Any) -> str:
     if priority is None:
         return "N/A"
     
-    priority_map = {
-        1: "Critical",
-        2: "High", 
-        3: "Medium",
-        4: "Low"
-    }
-    
     priority_int = int(priority) if str(priority).isdigit() else None
-    return priority_map.get(priority_int, f"Unknown ({priority})")
+    return _PRIORITY_LABELS.get(priority_int, f"Unknown ({priority})")
 
 
 def _format_risk(risk: Any) -> str:
@@ -527,16 +547,8 @@ def _format_risk(risk: Any) -> str:
     if risk is None:
         return "N/A"
     
-    risk_map = {
-        1: "Very Low",
-        2: "Low",
-        3: "Medium", 
-        4: "High",
-        5: "Very High"
-    }
-    
     risk_int = int(risk) if str(risk).isdigit() else None
-    return risk_map.get(risk_int, f"Unknown ({risk})")
+    return _RISK_LABELS.get(risk_int, f"Unknown ({risk})")
 
 
 def _format_impact(impact: Any) -> str:
@@ -544,15 +556,8 @@ def _format_impact(impact: Any) -> str:
     if impact is None:
         return "N/A"
     
-    impact_map = {
-        1: "Critical",
-        2: "High",
-        3: "Medium", 
-        4: "Low"
-    }
-    
     impact_int = int(impact) if str(impact).isdigit() else None
-    return impact_map.get(impact_int, f"Unknown ({impact})")
+    return _IMPACT_LABELS.get(impact_int, f"Unknown ({impact})")
 
 
 def _format_date(date_str: Any) -> str:
@@ -576,6 +581,7 @@ def _format_date(date_str: Any) -> str:
         return str(date_str)
 
 
+@functools.cache
 def get_change_request_fields_info() -> str:
     """Get information about available change request fields.
     
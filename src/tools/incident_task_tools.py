@@ -1,16 +1,39 @@
 """Incident Task management tools for ServiceNow MCP Server."""
 
+import functools
 import logging
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-from api import ServiceNowClient
+from api import ServiceNowClient, ServiceNowValidationError
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class IncidentTaskUpdateResult:
+    """Outcome of a successful IncidentTaskTools.update_incident_task call."""
+    
+    updated_incident_task: Dict[str, Any]
+    message: str
+
+
+@dataclass(slots=True, frozen=True)
+class IncidentTaskCreateResult:
+    """Outcome of a successful IncidentTaskTools.create_incident_task call."""
+    
+    created_incident_task: Dict[str, Any]
+    task_number: str
+    message: str
+
+
 class IncidentTaskTools:
-    """Tools for managing ServiceNow incident tasks."""
+    """Tools for managing ServiceNow incident tasks.
+    
+    Methods return the raw ServiceNow records; rendering them with
+    format_incident_task_display is left to the handlers.
+    """
     
     def __init__(self, client: ServiceNowClient):
         """Initialize incident task tools with ServiceNow client.
@@ -27,39 +50,19 @@ class IncidentTaskTools:
             incident_task_number: The incident task number (e.g., TASK0133364)
             
         Returns:
-            Dictionary containing incident task details or error information
-        """
-        try:
-            logger.info(f"Fetching incident task: {incident_task_number}")
-            
-            # Call the API client
-            task_data = await self.client.get_incident_task(incident_task_number)
-            
-            logger.info(f"Successfully retrieved incident task: {incident_task_number}")
-            
-            return {
-                "success": True,
-                "incident_task": task_data,
-                "task_number": incident_task_number
-            }
-            
-        except Exception as e:
-            from api.exceptions import ServiceNowNotFoundError
+            Dictionary containing the incident task details
             
-            if isinstance(e, ServiceNowNotFoundError):
-                error_msg = f"Incident task '{incident_task_number}' not found"
-                logger.warning(error_msg)
-                return {
-                    "error": error_msg,
-                    "error_type": "not_found"
-                }
-            else:
-                error_msg = f"Unexpected error fetching incident task: {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                return {
-                    "error": error_msg,
-                    "error_type": "unexpected_error"
-                }
+        Raises:
+            ServiceNowNotFoundError: If incident task not found
+            ServiceNowAPIError: For other API errors
+        """
+        logger.info(f"Fetching incident task: {incident_task_number}")
+        
+        # Call the API client
+        task_data = await self.client.get_incident_task(incident_task_number)
+        
+        logger.info(f"Successfully retrieved incident task: {incident_task_number}")
+        return task_data
 
     async def update_incident_task(
         self,
@@ -70,7 +73,7 @@ class IncidentTaskTools:
         priority: Optional[int] = None,
         assignment_group: Optional[str] = None,
         assigned_to: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> IncidentTaskUpdateResult:
         """Update incident task by task number.
         
         Args:
@@ -83,15 +86,20 @@ class IncidentTaskTools:
             assigned_to: Assigned user details mapped to sys_user table entries
             
         Returns:
-            Dictionary containing update results or error information
+            IncidentTaskUpdateResult with the updated task data and a success message
+            
+        Raises:
+            ServiceNowValidationError: If the update parameters fail validation
+            ServiceNowNotFoundError: If incident task not found
+            ServiceNowAPIError: For other API errors
         """
+        logger.info(f"Updating incident task: {incident_task_number}")
+        
+        # Import models here to avoid circular imports
+        from models import IncidentTaskUpdateRequest
+        
+        # Validate input parameters
         try:
-            logger.info(f"Updating incident task: {incident_task_number}")
-            
-            # Import models here to avoid circular imports
-            from models import IncidentTaskUpdateRequest
-            
-            # Validate input parameters
             update_request = IncidentTaskUpdateRequest(
                 short_description=short_description,
                 state=state,
@@ -100,55 +108,30 @@ class IncidentTaskTools:
                 assignment_group=assignment_group,
                 assigned_to=assigned_to
             )
-            
-            # Build update data dictionary
-            update_data = update_request.model_dump(exclude_none=True)
-            
-            # Call the API client to update the incident task
-            response = await self.client.update_incident_task(
-                incident_task_number,
-                update_data
-            )
-            
-            # Check if response indicates success
-            if response and not isinstance(response, dict):
-                response = {"result": response}
-            
-            result = response.get("result", response)
-            
-            logger.info(f"Successfully updated incident task: {incident_task_number}")
-            
-            return {
-                "success": True,
-                "updated_incident_task": result,
-                "task_number": incident_task_number,
-                "message": f"Incident task {incident_task_number} updated successfully"
-            }
-            
         except ValueError as e:
-            error_msg = f"Invalid update parameters: {str(e)}"
-            logger.warning(error_msg)
-            return {
-                "error": error_msg,
-                "error_type": "validation_error"
-            }
-        except Exception as e:
-            from api.exceptions import ServiceNowNotFoundError
-            
-            if isinstance(e, ServiceNowNotFoundError):
-                error_msg = f"Incident task '{incident_task_number}' not found"
-                logger.warning(error_msg)
-                return {
-                    "error": error_msg,
-                    "error_type": "not_found"
-                }
-            else:
-                error_msg = f"Unexpected error updating incident task: {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                return {
-                    "error": error_msg,
-                    "error_type": "unexpected_error"
-                }
+            logger.warning(f"Update data validation failed for incident task {incident_task_number}: {e}")
+            raise ServiceNowValidationError(f"Invalid update parameters: {str(e)}") from e
+        
+        # Build update data dictionary
+        update_data = update_request.model_dump(exclude_none=True)
+        
+        # Call the API client to update the incident task
+        response = await self.client.update_incident_task(
+            incident_task_number,
+            update_data
+        )
+        
+        # Check if response indicates success
+        if response and not isinstance(response, dict):
+            response = {"result": response}
+        
+        result = response.get("result", response)
+        
+        logger.info(f"Successfully updated incident task: {incident_task_number}")
+        return IncidentTaskUpdateResult(
+            updated_incident_task=result,
+            message=f"Incident task {incident_task_number} updated successfully"
+        )
 
     async def create_incident_task(
         self,
@@ -161,7 +144,7 @@ class IncidentTaskTools:
         priority: Optional[int] = None,
         assignment_group: Optional[str] = None,
         assigned_to: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> IncidentTaskCreateResult:
         """Create a new incident task.
         
         Args:
@@ -176,15 +159,19 @@ class IncidentTaskTools:
             assigned_to: Assigned user details mapped to sys_user table entries
             
         Returns:
-            Dictionary containing creation results or error information
+            IncidentTaskCreateResult with the created task data, its number and a success message
+            
+        Raises:
+            ServiceNowValidationError: If the creation parameters fail validation
+            ServiceNowAPIError: For API errors
         """
+        logger.info("Creating new incident task")
+        
+        # Import models here to avoid circular imports
+        from models import IncidentTaskCreateRequest
+        
+        # Validate input parameters
         try:
-            logger.info("Creating new incident task")
-            
-            # Import models here to avoid circular imports
-            from models import IncidentTaskCreateRequest
-            
-            # Validate input parameters
             create_request = IncidentTaskCreateRequest(
                 incident_number=incident_number,
                 short_description=short_description,
@@ -196,44 +183,29 @@ class IncidentTaskTools:
                 assignment_group=assignment_group,
                 assigned_to=assigned_to
             )
-            
-            # Build creation data dictionary
-            task_data = create_request.model_dump(exclude_none=True)
-            
-            # Call the API client to create the incident task
-            response = await self.client.create_incident_task(task_data)
-            
-            # Check if response indicates success
-            if response and not isinstance(response, dict):
-                response = {"result": response}
-            
-            result = response.get("result", response)
-            task_number = result.get("task_number", "Unknown")
-            
-            logger.info(f"Successfully created incident task: {task_number}")
-            
-            return {
-                "success": True,
-                "created_incident_task": result,
-                "task_number": task_number,
-                "message": f"Incident task {task_number} created successfully"
-            }
-            
         except ValueError as e:
-            error_msg = f"Invalid creation parameters: {str(e)}"
-            logger.warning(error_msg)
-            return {
-                "error": error_msg,
-                "error_type": "validation_error"
-            }
-        except Exception as e:
-            error_msg = f"Unexpected error creating incident task: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            return {
-                "error": error_msg,
-                "error_type": "unexpected_error"
-            }
-
+            logger.warning(f"Creation data validation failed for incident task: {e}")
+            raise ServiceNowValidationError(f"Invalid creation parameters: {str(e)}") from e
+        
+        # Build creation data dictionary
+        task_data = create_request.model_dump(exclude_none=True)
+        
+        # Call the API client to create the incident task
+        response = await self.client.create_incident_task(task_data)
+        
+        # Check if response indicates success
+        if response and not isinstance(response, dict):
+            response = {"result": response}
+        
+        result = response.get("result", response)
+        task_number = result.get("task_number", "Unknown")
+        
+        logger.info(f"Successfully created incident task: {task_number}")
+        return IncidentTaskCreateResult(
+            created_incident_task=result,
+            task_number=task_number,
+            message=f"Incident task {task_number} created successfully"
+        )
 
 def format_incident_task_display(incident_task: Dict[str, Any]) -> str:
     """Format an incident task for display.
@@ -333,6 +305,7 @@ def _format_date(date_str: Optional[str]) -> str:
     return date_str
 
 
+@functools.cache
 def get_incident_task_fields_info() -> str:
     """Get information about incident task fields.
     
@@ -1,14 +1,76 @@
 """Incident-related MCP tools."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
+import functools
 import logging
-from api import ServiceNowClient, ServiceNowAPIError, ServiceNowNotFoundError
+from dataclasses import dataclass
+from api import ServiceNowClient, ServiceNowAPIError, ServiceNowValidationError
 from models.incident import IncidentResponse, IncidentUpdateRequest, IncidentCreateRequest, IncidentSearchRequest
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class IncidentUpdateResult:
+    """Outcome of a successful IncidentTools.update_incident call."""
+    
+    updated_incident: Dict[str, Any]
+    message: str
+
+
+@dataclass(slots=True, frozen=True)
+class IncidentCreateResult:
+    """Outcome of a successful IncidentTools.create_incident call."""
+    
+    created_incident: Dict[str, Any]
+    incident_number: str
+    message: str
+
+
+@dataclass(slots=True, frozen=True)
+class IncidentSearchResult:
+    """Outcome of a successful IncidentTools.search_incidents call."""
+    
+    incidents: List[Any]
+    count: int
+    search_criteria: Dict[str, Any]
+    message: str
+
+# Label/field pairs shown in each section of format_incident_display
+_BASIC_FIELDS = (
+    ("Number", "number"),
+    ("State", "state"),
+    ("Priority", "priority"),
+    ("Impact", "impact"),
+    ("Urgency", "urgency"),
+    ("Short Description", "short_description"),
+)
+
+_CONTACT_FIELDS = (
+    ("Requested By", "requested_by"),
+    ("Company", "company"),
+    ("Service", "service_name"),
+    ("Category", "category"),
+    ("Subcategory", "subcategory"),
+)
+
+_ASSIGNMENT_FIELDS = (
+    ("Assignment Group", "assignment_group"),
+    ("Assigned To", "assigned_to"),
+    ("Configuration Item", "configuration_item"),
+)
+
+_TIME_FIELDS = (
+    ("Created Date", "created_date"),
+    ("Created By", "created_by"),
+    ("Modified Date", "modified_date"),
+    ("Modified By", "modified_by"),
+    ("Closed Date", "closed_date"),
+    ("Closed By", "closed_by"),
+)
+
+
 def format_incident_display(incident: Dict[str, Any]) -> str:
     """Format incident data for human-readable display.
     
@@ -22,65 +84,33 @@ def format_incident_display(incident: Dict[str, Any]) -> str:
     lines.append("=" * 60)
     
     # Basic information section
-    basic_fields = [
-        ("Number", "number"),
-        ("State", "state"),
-        ("Priority", "priority"),
-        ("Impact", "impact"),
-        ("Urgency", "urgency"),
-        ("Short Description", "short_description"),
-    ]
-    
     lines.append("\nBasic Information:")
     lines.append("-" * 20)
-    for label, field in basic_fields:
+    for label, field in _BASIC_FIELDS:
         value = incident.get(field, "N/A")
         if value and value != "N/A":
             lines.append(f"{label}: {value}")
     
     # Contact information section
-    contact_fields = [
-        ("Requested By", "requested_by"),
-        ("Company", "company"),
-        ("Service", "service_name"),
-        ("Category", "category"),
-        ("Subcategory", "subcategory"),
-    ]
-    
     lines.append("\nContact & Classification:")
     lines.append("-" * 28)
-    for label, field in contact_fields:
+    for label, field in _CONTACT_FIELDS:
         value = incident.get(field, "N/A")
         if value and value != "N/A":
             lines.append(f"{label}: {value}")
     
     # Assignment information
-    assignment_fields = [
-        ("Assignment Group", "assignment_group"),
-        ("Assigned To", "assigned_to"),
-        ("Configuration Item", "configuration_item"),
-    ]
-    
     lines.append("\nAssignment:")
     lines.append("-" * 11)
-    for label, field in assignment_fields:
+    for label, field in _ASSIGNMENT_FIELDS:
         value = incident.get(field, "N/A")
         if value and value != "N/A":
             lines.append(f"{label}: {value}")
     
     # Timestamps
-    time_fields = [
-        ("Created Date", "created_date"),
-        ("Created By", "created_by"),
-        ("Modified Date", "modified_date"),
-        ("Modified By", "modified_by"),
-        ("Closed Date", "closed_date"),
-        ("Closed By", "closed_by"),
-    ]
-    
     lines.append("\nTimestamps:")
     lines.append("-" * 11)
-    for label, field in time_fields:
+    for label, field in _TIME_FIELDS:
         value = incident.get(field)
         if value:
             lines.append(f"{label}: {value}")
@@ -140,6 +170,7 @@ def format_incident_display(incident: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+@functools.cache
 def get_incident_fields_info() -> str:
     """Get formatted list of all available incident fields and their descriptions.
     
@@ -266,41 +297,20 @@ class IncidentTools:
             ServiceNowNotFoundError: If incident not found
             ServiceNowAPIError: For other API errors
         """
+        logger.debug(f"Fetching incident details for: {incident_number}")
+        incident_data = await self.client.get_incident(incident_number)
+        
+        # Validate with Pydantic model if needed
         try:
-            logger.debug(f"Fetching incident details for: {incident_number}")
-            incident_data = await self.client.get_incident(incident_number)
-            
-            # Validate with Pydantic model if needed
-            try:
-                incident = IncidentResponse(**incident_data)
-                logger.debug(f"Successfully validated incident data for: {incident_number}")
-                return incident.model_dump()
-            except Exception as e:
-                logger.warning(f"Data validation failed for incident {incident_number}: {e}")
-                # Return raw data if validation fails
-                return incident_data
-                
-        except ServiceNowNotFoundError:
-            logger.warning(f"Incident not found: {incident_number}")
-            return {
-                "error": f"Incident {incident_number} not found",
-                "error_type": "not_found"
-            }
-        except ServiceNowAPIError as e:
-            logger.error(f"API error fetching incident {incident_number}: {e}")
-            return {
-                "error": str(e),
-                "error_type": "api_error",
-                "status_code": getattr(e, "status_code", None)
-            }
+            incident = IncidentResponse.model_validate(incident_data)
+            logger.debug(f"Successfully validated incident data for: {incident_number}")
+            return incident.model_dump()
         except Exception as e:
-            logger.error(f"Unexpected error fetching incident {incident_number}: {e}")
-            return {
-                "error": f"Unexpected error: {str(e)}",
-                "error_type": "unknown"
-            }
+            logger.warning(f"Data validation failed for incident {incident_number}: {e}")
+            # Return raw data if validation fails
+            return incident_data
     
-    async def update_incident(self, incident_number: str, **kwargs) -> Dict[str, Any]:
+    async def update_incident(self, incident_number: str, **kwargs) -> IncidentUpdateResult:
         """Update incident record by incident number.
         
         This tool updates an existing ServiceNow incident with new values.
@@ -324,75 +334,44 @@ class IncidentTools:
                 - resolution_info: Resolution details (dict with resolution_code, resolution_notes, etc.)
                 
         Returns:
-            Dictionary containing:
-                - success: True if update successful
-                - updated_incident: Updated incident data
-                - message: Success message
-                Or error information if failed
+            IncidentUpdateResult with the updated incident data and a success message
                 
         Raises:
+            ServiceNowValidationError: If no fields are given or they fail validation
             ServiceNowNotFoundError: If incident not found
             ServiceNowAPIError: For other API errors
         """
+        logger.debug(f"Updating incident: {incident_number}")
+        
+        # Create update request data, filtering out None values
+        update_data = {k: v for k, v in kwargs.items() if v is not None}
+        
+        if not update_data:
+            raise ServiceNowValidationError("No update fields provided")
+        
+        # Add the incident number to the update data
+        update_data["number"] = incident_number
+        
+        # Validate update data with Pydantic model
         try:
-            logger.debug(f"Updating incident: {incident_number}")
-            
-            # Create update request data, filtering out None values
-            update_data = {k: v for k, v in kwargs.items() if v is not None}
-            
-            if not update_data:
-                return {
-                    "error": "No update fields provided",
-                    "error_type": "validation_error"
-                }
-            
-            # Add the incident number to the update data
-            update_data["number"] = incident_number
-            
-            # Validate update data with Pydantic model
-            try:
-                update_request = IncidentUpdateRequest(**update_data)
-                validated_data = update_request.model_dump(exclude_none=True)
-                logger.debug(f"Validated update data for incident {incident_number}")
-            except Exception as e:
-                logger.warning(f"Update data validation failed for incident {incident_number}: {e}")
-                return {
-                    "error": f"Invalid update data: {str(e)}",
-                    "error_type": "validation_error"
-                }
-            
-            # Remove incident number from the data sent to API (it's in the URL)
-            api_data = {k: v for k, v in validated_data.items() if k != "number"}
-            
-            # Make the API call
-            updated_data = await self.client.update_incident(incident_number, api_data)
-            
-            logger.info(f"Successfully updated incident: {incident_number}")
-            return {
-                "success": True,
-                "updated_incident": updated_data,
-                "message": f"Incident {incident_number} updated successfully"
-            }
-                
-        except ServiceNowNotFoundError:
-            logger.warning(f"Incident not found for update: {incident_number}")
-            return {
-                "error": f"Incident {incident_number} not found",
-                "error_type": "not_found"
-            }
-        except ServiceNowAPIError as e:
-            logger.error(f"API error updating incident {incident_number}: {e}")
-            return {
-                "error": str(e),
-                "error_type": "api_error",
-                "status_code": getattr(e, "status_code", None)
-            }
+            update_request = IncidentUpdateRequest.model_validate(update_data)
+            validated_data = update_request.model_dump(exclude_none=True)
+            logger.debug(f"Validated update data for incident {incident_number}")
         except Exception as e:
-            logger.error(f"Unexpected error updating incident {incident_number}: {e}")
-            return {
-                "error": f"Unexpected error: {str(e)}",
-                "error_type": "unknown"
-            }
+            logger.warning(f"Update data validation failed for incident {incident_number}: {e}")
+            raise ServiceNowValidationError(f"Invalid update data: {str(e)}") from e
+        
+        # Remove incident number from the data sent to API (it's in the URL)
+        api_data = {k: v for k, v in validated_data.items() if k != "number"}
+        
+        # Make the API call
+        updated_data = await self.client.update_incident(incident_number, api_data)
+        
+        logger.info(f"Successfully updated incident: {incident_number}")
+        return IncidentUpdateResult(
+            updated_incident=updated_data,
+            message=f"Incident {incident_number} updated successfully"
+        )
     
     async def create_incident(
         self,
@@ -408,7 +387,7 @@ class IncidentTools:
         assignment_group: str = None,
         contact_type: str = None,
         customer_reference_id: str = None
-    ) -> Dict[str, Any]:
+    ) -> IncidentCreateResult:
         """Create a new incident record.
         
         This tool creates a new ServiceNow incident with the provided details.
@@ -429,89 +408,75 @@ class IncidentTools:
             customer_reference_id: Customer ticket ID
                 
         Returns:
-            Dictionary containing:
-                - success: True if creation successful
-                - created_incident: Created incident data with incident number
-                - message: Success message
-                Or error information if failed
+            IncidentCreateResult with the created incident data, its number
+            and a success message
                 
         Raises:
+            ServiceNowValidationError: If the create data fails validation
             ServiceNowAPIError: For API errors
         """
+        logger.debug("Creating new incident")
+        
+        # Build create request data
+        create_data = {
+            "short_description": short_description,
+            "description": description,
+            "service_name": service_name,
+            "urgency": urgency,
+        }
+        
+        # Add optional fields if provided
+        optional_fields = {
+            "impact": impact,
+            "category": category,
+            "subcategory": subcategory,
+            "configuration_item": configuration_item,
+            "assigned_to": assigned_to,
+            "assignment_group": assignment_group,
+            "contact_type": contact_type,
+            "customer_reference_id": customer_reference_id,
+        }
+        
+        for key, value in optional_fields.items():
+            if value is not None:
+                create_data[key] = value
+        
+        # Validate create data with Pydantic model
         try:
-            logger.debug("Creating new incident")
-            
-            # Build create request data
-            create_data = {
-                "short_description": short_description,
-                "description": description,
-                "service_name": service_name,
-                "urgency": urgency,
-            }
-            
-            # Add optional fields if provided
-            optional_fields = {
-                "impact": impact,
-                "category": category,
-                "subcategory": subcategory,
-                "configuration_item": configuration_item,
-                "assigned_to": assigned_to,
-                "assignment_group": assignment_group,
-                "contact_type": contact_type,
-                "customer_reference_id": customer_reference_id,
-            }
-            
-            for key, value in optional_fields.items():
-                if value is not None:
-                    create_data[key] = value
-            
-            # Validate create data with Pydantic model
-            try:
-                create_request = IncidentCreateRequest(**create_data)
-                validated_data = create_request.model_dump(exclude_none=True)
-                logger.debug("Validated create data for new incident")
-            except Exception as e:
-                logger.warning(f"Create data validation failed: {e}")
-                return {
-                    "error": f"Invalid create data: {str(e)}",
-                    "error_type": "validation_error"
-                }
-            
-            # Make the API call
-            created_data = await self.client.create_incident(validated_data)
-            
-            # Extract incident number from response
-            incident_number = created_data.get("number", "Unknown")
-            logger.info(f"Successfully created incident: {incident_number}")
-            
-            return {
-                "success": True,
-                "created_incident": created_data,
-                "incident_number": incident_number,
-                "message": f"Incident {incident_number} created successfully"
-            }
-                
-        except ServiceNowAPIError as e:
-            logger.error(f"API error creating incident: {e}")
-            return {
-                "error": str(e),
-                "error_type": "api_error",
-                "status_code": getattr(e, "status_code", None)
-            }
+            create_request = IncidentCreateRequest.model_validate(create_data)
+            validated_data = create_request.model_dump(exclude_none=True)
+            logger.debug("Validated create data for new incident")
         except Exception as e:
-            logger.error(f"Unexpected error creating incident: {e}")
-            return {
-                "error": f"Unexpected error: {str(e)}",
-                "error_type": "unknown"
-            }
+            logger.warning(f"Create data validation failed: {e}")
+            raise ServiceNowValidationError(f"Invalid create data: {str(e)}") from e
+        
+        # Make the API call
+        created_data = await self.client.create_incident(validated_data)
+        
+        # Extract incident number from response
+        incident_number = created_data.get("number", "Unknown")
+        logger.info(f"Successfully created incident: {incident_number}")
+        
+        return IncidentCreateResult(
+            created_incident=created_data,
+            incident_number=incident_number,
+            message=f"Incident {incident_number} created successfully"
+        )
     
-    async def search_incidents(self, **kwargs) -> Dict[str, Any]:
+    async def search_incidents(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        **kwargs
+    ) -> IncidentSearchResult:
         """Search incident records based on query parameters.
         
         This tool searches for ServiceNow incidents matching the specified criteria.
         All search parameters are optional. If no parameters are provided, returns active incidents.
         
         Args:
+            fields: Columns to fetch for each incident; all columns if None
+            limit: Maximum number of incidents to fetch; all matches if None
             **kwargs: Search parameters including:
                 - active: Select active records (default True)
                 - requested_by: Search by incident requestor name
@@ -526,99 +491,66 @@ class IncidentTools:
                 - assigned_to: Search by assigned user
                 
         Returns:
-            Dictionary containing:
-                - success: True if search successful
-                - incidents: List of matching incidents
-                - count: Number of incidents found
-                - message: Search summary
-                Or error information if failed
+            IncidentSearchResult with the matching incidents, their count,
+            the validated search parameters and a summary message
                 
         Raises:
-            ServiceNowAPIError: For API errors
+            ServiceNowValidationError: If the search parameters fail validation
+            ServiceNowAPIError: For API errors or an unexpected response format
         """
+        logger.debug("Searching incidents with criteria")
+        
+        # Build search request data, filtering out None values
+        search_data = {k: v for k, v in kwargs.items() if v is not None}
+        
+        # Set default active=True if not specified
+        if "active" not in search_data:
+            search_data["active"] = True
+        
+        # Validate search data with Pydantic model
         try:
-            logger.debug("Searching incidents with criteria")
-            
-            # Build search request data, filtering out None values
-            search_data = {k: v for k, v in kwargs.items() if v is not None}
-            
-            # Set default active=True if not specified
-            if "active" not in search_data:
-                search_data["active"] = True
-            
-            # Validate search data with Pydantic model
-            try:
-                search_request = IncidentSearchRequest(**search_data)
-                validated_data = search_request.model_dump(exclude_none=True)
-                logger.debug(f"Validated search data: {validated_data}")
-            except Exception as e:
-                logger.warning(f"Search data validation failed: {e}")
-                return {
-                    "error": f"Invalid search parameters: {str(e)}",
-                    "error_type": "validation_error"
-                }
-            
-            # Make the API call
-            search_results = await self.client.search_incidents(validated_data)
-            
-            # Debug logging to understand the response format
-            logger.debug(f"Search results type: {type(search_results)}")
-            logger.debug(f"Search results content: {search_results}")
-            
-            # Handle different response formats
-            if isinstance(search_results, str):
-                # Handle string response - this shouldn't happen but let's be defensive
-                logger.warning(f"Received string response from search_incidents: {search_results}")
-                return {
-                    "error": f"Unexpected string response from API: {search_results}",
-                    "error_type": "api_error"
-                }
-            elif isinstance(search_results, list):
-                incidents = search_results
-            elif isinstance(search_results, dict):
-                if "incidents" in search_results:
-                    incidents = search_results["incidents"]
-                elif "result" in search_results:
-                    incidents = search_results["result"]
-                else:
-                    # If it's a dict but doesn't have expected keys, treat it as a single incident
-                    incidents = [search_results]
-            else:
-                # Fallback - try to convert to list
-                try:
-                    incidents = [search_results] if search_results is not None else []
-                except Exception as e:
-                    logger.error(f"Could not handle search results format: {type(search_results)}, error: {e}")
-                    return {
-                        "error": f"Unexpected response format from API: {type(search_results)}",
-                        "error_type": "api_error"
-                    }
-            
-            # Ensure incidents is a list
-            if not isinstance(incidents, list):
-                incidents = [incidents] if incidents else []
-            
-            count = len(incidents)
-            logger.info(f"Found {count} incidents matching search criteria")
-            
-            return {
-                "success": True,
-                "incidents": incidents,
-                "count": count,
-                "search_criteria": validated_data,
-                "message": f"Found {count} incident(s) matching search criteria"
-            }
-                
-        except ServiceNowAPIError as e:
-            logger.error(f"API error searching incidents: {e}")
-            return {
-                "error": str(e),
-                "error_type": "api_error",
-                "status_code": getattr(e, "status_code", None)
-            }
+            search_request = IncidentSearchRequest.model_validate(search_data)
+            validated_data = search_request.model_dump(exclude_none=True)
+            logger.debug(f"Validated search data: {validated_data}")
         except Exception as e:
-            logger.error(f"Unexpected error searching incidents: {e}")
-            return {
-                "error": f"Unexpected error: {str(e)}",
-                "error_type": "unknown"
-            }
\ No newline at end of file
+            logger.warning(f"Search data validation failed: {e}")
+            raise ServiceNowValidationError(f"Invalid search parameters: {str(e)}") from e
+        
+        # Make the API call
+        search_results = await self.client.search_incidents(validated_data, fields, limit)
+        
+        # Debug logging to understand the response format
+        logger.debug(f"Search results type: {type(search_results)}")
+        logger.debug(f"Search results content: {search_results}")
+        
+        # Handle different response formats
+        if isinstance(search_results, str):
+            # Handle string response - this shouldn't happen but let's be defensive
+            logger.warning(f"Received string response from search_incidents: {search_results}")
+            raise ServiceNowAPIError(f"Unexpected string response from API: {search_results}")
+        elif isinstance(search_results, list):
+            incidents = search_results
+        elif isinstance(search_results, dict):
+            if "incidents" in search_results:
+                incidents = search_results["incidents"]
+            elif "result" in search_results:
+                incidents = search_results["result"]
+            else:
+                # If it's a dict but doesn't have expected keys, treat it as a single incident
+                incidents = [search_results]
+        else:
+            incidents = [search_results] if search_results is not None else []
+        
+        # Ensure incidents is a list
+        if not isinstance(incidents, list):
+            incidents = [incidents] if incidents else []
+        
+        count = len(incidents)
+        logger.info(f"Found {count} incidents matching search criteria")
+        
+        return IncidentSearchResult(
+            incidents=incidents,
+            count=count,
+            search_criteria=validated_data,
+            message=f"Found {count} incident(s) matching search criteria"
+        )
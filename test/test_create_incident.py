@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 async def test_create_incident():
     try:
         from tools.incident_tools import IncidentTools
+        from api import ServiceNowAPIError
         from api.client import ServiceNowClient
         from config import get_servicenow_config
         
@@ -31,29 +32,29 @@ async def test_create_incident():
         print(f"Service: ITOM UAT PowerFlex")
         print(f"Urgency: 3 (Medium)")
         
-        create_result = await tools.create_incident(
-            short_description=test_short_desc,
-            description=test_description,
-            service_name="ITOM UAT PowerFlex",  # Using service from existing incident
-            urgency=3,  # Medium urgency
-            impact=3,   # Medium impact
-            category="Technical Support",
-            subcategory="Product Request",
-            contact_type="Self-Service",
-            customer_reference_id=f"TEST_{timestamp}"
-        )
-        
-        if "error" in create_result:
-            print(f"❌ Create Error: {create_result['error']}")
-            print(f"🔍 Error type: {create_result.get('error_type', 'unknown')}")
+        try:
+            create_result = await tools.create_incident(
+                short_description=test_short_desc,
+                description=test_description,
+                service_name="ITOM UAT PowerFlex",  # Using service from existing incident
+                urgency=3,  # Medium urgency
+                impact=3,   # Medium impact
+                category="Technical Support",
+                subcategory="Product Request",
+                contact_type="Self-Service",
+                customer_reference_id=f"TEST_{timestamp}"
+            )
+        except ServiceNowAPIError as e:
+            print(f"❌ Create Error: {e}")
+            print(f"🔍 Error type: {type(e).__name__}")
         else:
             print("✅ Creation successful!")
-            incident_number = create_result.get('incident_number', 'Unknown')
+            incident_number = create_result.incident_number
             print(f"📄 Created Incident: {incident_number}")
-            print(f"📄 Message: {create_result.get('message', 'No message')}")
+            print(f"📄 Message: {create_result.message}")
             
             # Show the created incident details if available
-            created_incident = create_result.get('created_incident')
+            created_incident = create_result.created_incident
             if created_incident:
                 print(f"\n📊 Created incident details:")
                 print(f"Number: {created_incident.get('number', 'N/A')}")
@@ -11,6 +11,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 async def test_search_incidents():
     try:
         from tools.incident_tools import IncidentTools
+        from api import ServiceNowAPIError
         from api.client import ServiceNowClient
         from config import get_servicenow_config
         
@@ -22,15 +23,15 @@ async def test_search_incidents():
         
         # Test 1: Search all active incidents (default)
         print("\n🔧 Test 1: Search all active incidents (default)...")
-        search_result = await tools.search_incidents()
-        
-        if "error" in search_result:
-            print(f"❌ Search Error: {search_result['error']}")
-            print(f"🔍 Error type: {search_result.get('error_type', 'unknown')}")
+        try:
+            search_result = await tools.search_incidents()
+        except ServiceNowAPIError as e:
+            print(f"❌ Search Error: {e}")
+            print(f"🔍 Error type: {type(e).__name__}")
         else:
             print("✅ Search successful!")
-            count = search_result.get('count', 0)
-            incidents = search_result.get('incidents', [])
+            count = search_result.count
+            incidents = search_result.incidents
             print(f"📄 Found {count} active incidents")
             
             if count > 0:
@@ -43,55 +44,55 @@ async def test_search_incidents():
         
         # Test 2: Search by specific company
         print(f"\n🔧 Test 2: Search by company 'Blockbuster Music'...")
-        search_result = await tools.search_incidents(company="Blockbuster Music")
-        
-        if "error" in search_result:
-            print(f"❌ Company Search Error: {search_result['error']}")
+        try:
+            search_result = await tools.search_incidents(company="Blockbuster Music")
+        except ServiceNowAPIError as e:
+            print(f"❌ Company Search Error: {e}")
         else:
-            count = search_result.get('count', 0)
+            count = search_result.count
             print(f"✅ Found {count} incidents for Blockbuster Music")
         
         # Test 3: Search by state (In Progress)
         print(f"\n🔧 Test 3: Search by state 'In Progress' (state=2)...")
-        search_result = await tools.search_incidents(state=2)
-        
-        if "error" in search_result:
-            print(f"❌ State Search Error: {search_result['error']}")
+        try:
+            search_result = await tools.search_incidents(state=2)
+        except ServiceNowAPIError as e:
+            print(f"❌ State Search Error: {e}")
         else:
-            count = search_result.get('count', 0)
+            count = search_result.count
             print(f"✅ Found {count} incidents in 'In Progress' state")
         
         # Test 4: Search by priority (High)
         print(f"\n🔧 Test 4: Search by priority 'High' (priority=2)...")
-        search_result = await tools.search_incidents(priority=2)
-        
-        if "error" in search_result:
-            print(f"❌ Priority Search Error: {search_result['error']}")
+        try:
+            search_result = await tools.search_incidents(priority=2)
+        except ServiceNowAPIError as e:
+            print(f"❌ Priority Search Error: {e}")
         else:
-            count = search_result.get('count', 0)
+            count = search_result.count
             print(f"✅ Found {count} high priority incidents")
         
         # Test 5: Search by service name
         print(f"\n🔧 Test 5: Search by service 'ITOM UAT PowerFlex'...")
-        search_result = await tools.search_incidents(service_name="ITOM UAT PowerFlex")
-        
-        if "error" in search_result:
-            print(f"❌ Service Search Error: {search_result['error']}")
+        try:
+            search_result = await tools.search_incidents(service_name="ITOM UAT PowerFlex")
+        except ServiceNowAPIError as e:
+            print(f"❌ Service Search Error: {e}")
         else:
-            count = search_result.get('count', 0)
+            count = search_result.count
             print(f"✅ Found {count} incidents for ITOM UAT PowerFlex service")
         
         # Test 6: Combined search (company and priority)
         print(f"\n🔧 Test 6: Combined search (company + priority)...")
-        search_result = await tools.search_incidents(
-            company="Blockbuster Music",
-            priority=2
-        )
-        
-        if "error" in search_result:
-            print(f"❌ Combined Search Error: {search_result['error']}")
+        try:
+            search_result = await tools.search_incidents(
+                company="Blockbuster Music",
+                priority=2
+            )
+        except ServiceNowAPIError as e:
+            print(f"❌ Combined Search Error: {e}")
         else:
-            count = search_result.get('count', 0)
+            count = search_result.count
             print(f"✅ Found {count} high priority incidents for Blockbuster Music")
             
         await client.close()
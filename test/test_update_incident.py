@@ -11,6 +11,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 async def test_update_incident():
     try:
         from tools.incident_tools import IncidentTools
+        from api import ServiceNowAPIError
         from api.client import ServiceNowClient
         from config import get_servicenow_config
         
@@ -22,9 +23,10 @@ async def test_update_incident():
         
         # First, get the current incident to see its current state
         print("\n📋 Current incident details:")
-        current_result = await tools.get_incident("INC9242849")
-        if "error" in current_result:
-            print(f"❌ Error fetching current incident: {current_result['error']}")
+        try:
+            current_result = await tools.get_incident("INC9242849")
+        except ServiceNowAPIError as e:
+            print(f"❌ Error fetching current incident: {e}")
             return
         
         print(f"Current State: {current_result.get('state', 'N/A')}")
@@ -33,21 +35,21 @@ async def test_update_incident():
         
         # Test update - just add comments and notes (safe operations)
         print("\n🔧 Testing update with comments and notes...")
-        update_result = await tools.update_incident(
-            "INC9242849",
-            comments="Test comment added via MCP server update tool",
-            notes="Test note added via MCP server - testing update functionality"
-        )
-        
-        if "error" in update_result:
-            print(f"❌ Update Error: {update_result['error']}")
-            print(f"🔍 Error type: {update_result.get('error_type', 'unknown')}")
+        try:
+            update_result = await tools.update_incident(
+                "INC9242849",
+                comments="Test comment added via MCP server update tool",
+                notes="Test note added via MCP server - testing update functionality"
+            )
+        except ServiceNowAPIError as e:
+            print(f"❌ Update Error: {e}")
+            print(f"🔍 Error type: {type(e).__name__}")
         else:
             print("✅ Update successful!")
-            print(f"📄 Response: {update_result.get('message', 'No message')}")
+            print(f"📄 Response: {update_result.message}")
             
             # Show the updated incident details if available
-            updated_incident = update_result.get('updated_incident')
+            updated_incident = update_result.updated_incident
             if updated_incident:
                 print("\n📊 Updated incident details:")
                 print(f"State: {updated_incident.get('state', 'N/A')}")